@@ -1,34 +1,45 @@
 # face_detection_recognition.py
-import cv2
-import face_recognition
-import numpy as np
+"""Webcam face detection (Haar cascade) and recognition against one known face.
 
-# Initialize face cascade (for detection) and load known faces (for recognition)
-face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+cv2 and face_recognition are imported, the cascade is built and the known face
+is encoded only when main() runs, so --help returns without loading them.
+"""
+import argparse
 
-# Load sample images for recognition (add your own images)
-known_image = face_recognition.load_image_file("known_person.jpg")
-known_encoding = face_recognition.face_encodings(known_image)[0]
+GREEN, RED, BLUE = (0, 255, 0), (0, 0, 255), (255, 0, 0)
 
-# Video capture setup
-video_capture = cv2.VideoCapture(0)
 
-while True:
-    # Grab frame from webcam
-    ret, frame = video_capture.read()
-    
+def load_detector():
+    """Initialize face cascade (for detection)."""
+    import cv2
+    return cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+
+
+def load_known_encoding(image_path):
+    """Load a sample image for recognition (add your own images) and encode its first face."""
+    import face_recognition
+    known_image = face_recognition.load_image_file(image_path)
+    return face_recognition.face_encodings(known_image)[0]
+
+
+def label_faces(frame, face_cascade, known_encoding, scale_factor=1.1, min_neighbors=4):
+    """Detect the faces in a BGR frame, recognize each one and draw its box and label in place."""
+    import cv2
+    import face_recognition
+    import numpy as np
+
     # Face Detection (using Haar Cascades - faster)
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-    
+    faces = face_cascade.detectMultiScale(gray, scale_factor, min_neighbors)
+
     # Convert to RGB for face_recognition
     rgb_frame = frame[:, :, ::-1]
-    
+
     # Face Recognition for each detected face
     for (x, y, w, h) in faces:
         # Crop face region
         face_image = rgb_frame[y:y+h, x:x+w]
-        
+
         try:
             # Get face encodings
             face_encodings = face_recognition.face_encodings(face_image)
@@ -36,34 +47,60 @@ while True:
                 # Compare with known face
                 matches = face_recognition.compare_faces([known_encoding], face_encodings[0])
                 face_distances = face_recognition.face_distance([known_encoding], face_encodings[0])
-                
+
                 # Best match
                 best_match_index = np.argmin(face_distances)
                 if matches[best_match_index]:
-                    name = "Known Person"
-                    color = (0, 255, 0)  # Green for recognized
+                    name, color = "Known Person", GREEN  # Green for recognized
                 else:
-                    name = "Unknown"
-                    color = (0, 0, 255)  # Red for unknown
+                    name, color = "Unknown", RED  # Red for unknown
             else:
-                name = "No Face"
-                color = (255, 0, 0)  # Blue for detection-only
-            
+                name, color = "No Face", BLUE  # Blue for detection-only
+
             # Draw rectangle and label
             cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
             cv2.putText(frame, name, (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
-        
+
         except Exception as e:
             print(f"Recognition error: {e}")
             continue
-    
-    # Display result
-    cv2.imshow('Face Detection & Recognition', frame)
-    
-    # Exit on 'q'
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
-
-# Clean up
-video_capture.release()
-cv2.destroyAllWindows()
+    return frame
+
+
+def main(args):
+    import cv2
+
+    face_cascade = load_detector()
+    known_encoding = load_known_encoding(args.known)
+
+    # Video capture setup
+    video_capture = cv2.VideoCapture(args.camera)
+
+    while True:
+        # Grab frame from webcam
+        ret, frame = video_capture.read()
+        if not ret:
+            print("Could not read a frame from the camera.")
+            break
+
+        label_faces(frame, face_cascade, known_encoding, args.scale_factor, args.min_neighbors)
+
+        # Display result
+        cv2.imshow('Face Detection & Recognition', frame)
+
+        # Exit on 'q'
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            break
+
+    # Clean up
+    video_capture.release()
+    cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Webcam face detection and recognition")
+    parser.add_argument("--known", type=str, default="known_person.jpg", help="Photo of the person to recognize")
+    parser.add_argument("--camera", type=int, default=0, help="Camera index for cv2.VideoCapture")
+    parser.add_argument("--scale-factor", type=float, default=1.1, help="detectMultiScale scale factor")
+    parser.add_argument("--min-neighbors", type=int, default=4, help="detectMultiScale minimum neighbours")
+    main(parser.parse_args())
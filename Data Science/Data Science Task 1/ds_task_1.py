@@ -1,20 +1,14 @@
 import os
 import zipfile
 import argparse
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, classification_report
+# pandas and sklearn are imported inside the functions that use them,
+# so --help and argument errors return without loading them
 
 
 def load_dataset(zip_path: str):
     """Extract Titanic-Dataset.csv from the zip and return as DataFrame."""
+    import pandas as pd
+
     # Convert to absolute path to avoid VSCode relative path issues
     zip_path = os.path.abspath(zip_path)
 
@@ -38,6 +32,11 @@ def load_dataset(zip_path: str):
 
 
 def build_pipeline(numeric_features, categorical_features, model):
+    from sklearn.preprocessing import StandardScaler, OneHotEncoder
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline
+    from sklearn.impute import SimpleImputer
+
     numeric_transformer = Pipeline(steps=[
         ("imputer", SimpleImputer(strategy="median")),
         ("scaler", StandardScaler())
@@ -63,6 +62,12 @@ def build_pipeline(numeric_features, categorical_features, model):
 
 
 def main(zip_path, output_dir):
+    import pandas as pd
+    from sklearn.model_selection import train_test_split, cross_val_score
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import accuracy_score, classification_report
+
     df = load_dataset(zip_path)
 
     if "Survived" not in df.columns:
@@ -0,0 +1,80 @@
+# bench_features.py
+"""Memory and build time of the old dense encoding against ImdbFeatureBuilder at catalog scale."""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from bench_preprocessing import GENRES
+from imdb_features import ImdbFeatureBuilder
+from imdb_preprocessing import genre_dummies
+
+
+def make_titles(n_rows, seed=42):
+    """Cleaned IMDb-like titles with Zipf-distributed directors and actors."""
+    rng = np.random.default_rng(seed)
+    n_directors, n_actors = max(n_rows // 10, 10), max(n_rows // 3, 10)
+    combos = np.array([', '.join(rng.choice(GENRES, size=rng.integers(1, 4), replace=False))
+                       for _ in range(3000)], dtype=object)
+
+    def people(prefix, pool_size):
+        ids = (rng.zipf(1.3, n_rows) - 1) % pool_size
+        return pd.Series(ids).map(lambda i: f"{prefix} {i}").to_numpy(dtype=object)
+
+    return pd.DataFrame({
+        'year': rng.integers(1920, 2023, n_rows),
+        'duration_minutes': rng.normal(130, 25, n_rows).round(),
+        'votes_numeric': rng.lognormal(5, 2, n_rows).round(),
+        'rating': rng.uniform(1, 10, n_rows).round(1),
+        'genre': combos[rng.integers(0, len(combos), n_rows)],
+        'director': people('Director', n_directors),
+        'actor1': people('Actor', n_actors),
+        'actor2': people('Actor', n_actors),
+        'actor3': people('Actor', n_actors),
+    })
+
+
+def legacy_features(df):
+    # The encoding previously in ds_task_2.py: dense genre columns + label-encoded people
+    out = pd.concat([df[['year', 'duration_minutes', 'votes_numeric']].reset_index(drop=True),
+                     genre_dummies(df['genre'])], axis=1)
+    for col in ['director', 'actor1', 'actor2', 'actor3']:
+        out[f'{col}_encoded'] = LabelEncoder().fit_transform(df[col].astype(str))
+    return out
+
+
+def csr_mb(X):
+    return (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 2**20
+
+
+def main(n_rows):
+    print(f"Generating {n_rows:,} synthetic titles...")
+    df = make_titles(n_rows)
+
+    rows = []
+    start = time.perf_counter()
+    legacy = legacy_features(df)
+    rows.append(('legacy dense + LabelEncoder', legacy.shape[1],
+                 legacy.memory_usage(deep=True).sum() / 2**20, time.perf_counter() - start))
+
+    for mode in ['onehot', 'hash']:
+        start = time.perf_counter()
+        builder = ImdbFeatureBuilder(people_encoding=mode)
+        X = builder.fit_transform(df)
+        rows.append((f'sparse CSR ({mode})', X.shape[1], csr_mb(X), time.perf_counter() - start))
+        if mode == 'onehot':
+            # what the same one-hot features would cost as a dense float64 frame
+            rows.append(('dense one-hot (not built)', X.shape[1], n_rows * X.shape[1] * 8 / 2**20, float('nan')))
+
+    print(f"\n{'encoding':<30}{'columns':>10}{'memory (MB)':>16}{'build (s)':>11}")
+    for name, n_cols, mb, seconds in rows:
+        print(f"{name:<30}{n_cols:>10,}{mb:>16,.1f}{seconds:>11.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of synthetic titles")
+    args = parser.parse_args()
+    main(args.rows)
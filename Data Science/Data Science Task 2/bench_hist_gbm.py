@@ -0,0 +1,67 @@
+# bench_hist_gbm.py
+"""Training time and test R2 of exact vs histogram gradient boosting on IMDb data at 1x/10x/100x.
+
+The real titles are split into train/test first; only the training part is
+scaled up (bootstrap resampling with a little numeric jitter), and every run
+is scored on the same untouched test titles.
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+
+from ds_task_2 import make_models
+from imdb_features import ImdbFeatureBuilder
+from imdb_loading import load_imdb
+from imdb_preprocessing import clean_imdb
+
+SOURCE = Path(__file__).resolve().parent / "IMDb Movies India.csv"
+
+
+def upsample(df, factor, seed=42):
+    """Bootstrap df to factor x its size, jittering the numeric columns."""
+    rng = np.random.default_rng(seed)
+    big = df.iloc[rng.integers(0, len(df), len(df) * factor)].reset_index(drop=True)
+    if factor > 1:
+        big['duration_minutes'] = big['duration_minutes'] + rng.normal(0, 2, len(big)).round()
+        big['votes_numeric'] = (big['votes_numeric'] * rng.lognormal(0, 0.1, len(big))).round()
+    return big
+
+
+def main(scales, exact_max_rows):
+    df = clean_imdb(load_imdb(SOURCE))
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+    hist = make_models(['Hist Gradient Boosting Regressor'])['Hist Gradient Boosting Regressor']
+    models = {
+        'exact (GradientBoostingRegressor)': (GradientBoostingRegressor(n_estimators=100, random_state=42), False),
+        'histogram (HistGradientBoostingRegressor)': (hist, True),
+    }
+
+    print(f"\n{'scale':>6}{'rows':>12}  {'engine':<44}{'fit (s)':>10}{'test R2':>10}")
+    for scale in scales:
+        big = upsample(train_df, scale)
+        builder = ImdbFeatureBuilder().fit(big)
+        for name, (model, native) in models.items():
+            if not native and exact_max_rows and len(big) > exact_max_rows:
+                print(f"{scale:>5}x{len(big):>12,}  {name:<44}{'skipped':>10}")
+                continue
+            X_train = builder.transform_frame(big) if native else builder.transform(big)
+            X_test = builder.transform_frame(test_df) if native else builder.transform(test_df)
+            start = time.perf_counter()
+            model.fit(X_train, big['rating'])
+            fit_time = time.perf_counter() - start
+            r2 = r2_score(test_df['rating'], model.predict(X_test))
+            print(f"{scale:>5}x{len(big):>12,}  {name:<44}{fit_time:>10.2f}{r2:>10.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Training set size multipliers")
+    parser.add_argument("--exact-max-rows", type=int, default=0,
+                        help="Skip the exact engine above this many rows (0 = never skip)")
+    args = parser.parse_args()
+    main(args.scales, args.exact_max_rows)
@@ -0,0 +1,87 @@
+# bench_loading.py
+"""Load time and peak memory of the old encoding loop against imdb_loading on a large generated CSV.
+
+Each method runs in its own process so peak RSS is measured independently.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from imdb_loading import load_imdb, sniff_encoding
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, peak_mb  # noqa: E402
+
+SOURCE = Path(__file__).resolve().parent / "IMDb Movies India.csv"
+DATA_DIR = Path(__file__).resolve().parents[2] / "benchmarks" / "bench_data"
+METHODS = ['baseline', 'legacy', 'typed', 'chunked']
+
+
+def legacy_load(path):
+    # The loop previously in ds_task_2.py
+    for enc in ['utf-8', 'ISO-8859-1', 'Windows-1252', 'utf-16']:
+        try:
+            return pd.read_csv(path, encoding=enc)
+        except UnicodeDecodeError:
+            pass
+
+
+def generate(path, copies):
+    """Write the real IMDb CSV repeated `copies` times, keeping its Latin-1 encoding."""
+    raw = SOURCE.read_bytes()
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    header, body = raw.split(b'\n', 1)
+    with open(path, 'wb') as f:
+        f.write(header + b'\n')
+        for _ in range(copies):
+            f.write(body if body.endswith(b'\n') else body + b'\n')
+
+
+def run_worker(method, path):
+    start = time.perf_counter()
+    if method == 'legacy':
+        df = legacy_load(path)
+    elif method == 'typed':
+        df = load_imdb(path)
+    elif method == 'chunked':
+        df = load_imdb(path, chunksize=200_000)
+    else:
+        df = pd.DataFrame()
+    seconds = time.perf_counter() - start
+    frame_mb = df.memory_usage(deep=True).sum() / 2**20
+    print(json.dumps({'method': method, 'rows': len(df), 'seconds': seconds,
+                      'peak_rss_mb': peak_mb(), 'frame_mb': frame_mb}))
+
+
+def main(copies, path):
+    path = Path(path)
+    if not path.exists():
+        print(f"Generating {path} ({copies} copies of the dataset)...")
+        generate(path, copies)
+    print(f"File size: {path.stat().st_size / 2**20:.1f} MB, sniffed encoding: {sniff_encoding(path)}")
+
+    print(f"\n{'method':<10}{'rows':>12}{'load (s)':>10}{'peak RSS (MB)':>15}{'frame (MB)':>12}")
+    for method in METHODS:
+        out = subprocess.run([sys.executable, __file__, '--worker', method, '--file', str(path)],
+                             capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{r['method']:<10}{r['rows']:>12,}{r['seconds']:>10.2f}{fmt_mb(r['peak_rss_mb'], 15)}{r['frame_mb']:>12.0f}")
+    print("\n'baseline' is the interpreter with pandas imported and no data loaded.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--copies", type=int, default=200, help="How many times to repeat the dataset")
+    parser.add_argument("--file", type=str, default=str(DATA_DIR / "imdb_large.csv"), help="Generated CSV path")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.file)
+    else:
+        main(args.copies, args.file)
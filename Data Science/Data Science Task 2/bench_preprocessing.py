@@ -0,0 +1,92 @@
+# bench_preprocessing.py
+"""Compare the row-wise .apply cleaning with imdb_preprocessing on a synthetic IMDb-like table."""
+import argparse
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import MultiLabelBinarizer
+
+from imdb_preprocessing import clean_duration, clean_votes, genre_dummies
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import timed  # noqa: E402
+
+GENRES = ['Action', 'Adventure', 'Animation', 'Biography', 'Comedy', 'Crime', 'Documentary',
+          'Drama', 'Family', 'Fantasy', 'History', 'Horror', 'Music', 'Musical', 'Mystery',
+          'News', 'Romance', 'Sci-Fi', 'Sport', 'Thriller', 'War', 'Western']
+
+
+# Row-wise versions, as they were in ds_task_2.py
+def legacy_clean_duration(duration_str):
+    if isinstance(duration_str, str):
+        match = re.search(r'(\d+)\s*min', duration_str)
+        if match:
+            return int(match.group(1))
+    return np.nan
+
+
+def legacy_clean_votes(votes_str):
+    if isinstance(votes_str, str):
+        return int(votes_str.replace(',', ''))
+    return np.nan
+
+
+def legacy_genre_dummies(genre):
+    lists = genre.astype(str).apply(lambda x: [g.strip() for g in x.split(',') if g.strip()])
+    mlb = MultiLabelBinarizer()
+    return pd.DataFrame(mlb.fit_transform(lists), columns=mlb.classes_)
+
+
+def make_table(n_rows, seed=42):
+    """Build an IMDb-like frame by sampling from small pools of realistic raw strings."""
+    rng = np.random.default_rng(seed)
+
+    durations = np.array([f"{m} min" for m in range(45, 240)] + [np.nan] * 40, dtype=object)
+    votes = np.array([f"{v:,}" for v in rng.integers(5, 900_000, 5000)] + [np.nan] * 1500, dtype=object)
+    combos = []
+    for _ in range(3000):
+        picked = rng.choice(GENRES, size=rng.integers(1, 4), replace=False)
+        combos.append(', '.join(picked))
+    combos += [' , Drama', 'Comedy, ', 'Action,Thriller']
+    genres = np.array(combos, dtype=object)
+
+    return pd.DataFrame({
+        'duration': durations[rng.integers(0, len(durations), n_rows)],
+        'votes': votes[rng.integers(0, len(votes), n_rows)],
+        'genre': genres[rng.integers(0, len(genres), n_rows)],
+    })
+
+
+def main(n_rows):
+    print(f"Generating {n_rows:,} synthetic rows...")
+    df = make_table(n_rows)
+
+    steps = [
+        ('duration', lambda: df['duration'].apply(legacy_clean_duration), lambda: clean_duration(df['duration'])),
+        ('votes', lambda: df['votes'].apply(legacy_clean_votes), lambda: clean_votes(df['votes'])),
+        ('genre', lambda: legacy_genre_dummies(df['genre']), lambda: genre_dummies(df['genre'])),
+    ]
+
+    print(f"\n{'step':<10}{'apply (s)':>12}{'vectorized (s)':>16}{'speedup':>10}  identical")
+    total_old = total_new = 0.0
+    for name, old_fn, new_fn in steps:
+        old, t_old = timed(old_fn)
+        new, t_new = timed(new_fn)
+        if isinstance(old, pd.DataFrame):
+            same = old.columns.tolist() == new.columns.tolist() and np.array_equal(old.to_numpy(), new.to_numpy())
+        else:
+            same = np.allclose(old.astype('float64'), new, equal_nan=True)
+        total_old += t_old
+        total_new += t_new
+        print(f"{name:<10}{t_old:>12.2f}{t_new:>16.2f}{t_old / t_new:>9.1f}x  {same}")
+    print(f"{'total':<10}{total_old:>12.2f}{total_new:>16.2f}{total_old / total_new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Number of synthetic rows")
+    args = parser.parse_args()
+    main(args.rows)
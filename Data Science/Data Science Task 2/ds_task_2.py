@@ -1,236 +1,313 @@
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score, KFold
-from sklearn.preprocessing import MultiLabelBinarizer, LabelEncoder
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.tree import DecisionTreeRegressor
-from sklearn.metrics import mean_squared_error, r2_score
-import matplotlib.pyplot as plt
-import seaborn as sns
-import re
+# ds_task_2.py
+"""IMDb Movies India rating prediction.
+
+The pipeline is a graph of named stages (see stage_cache.py):
+
+    load -> clean -> folds -> fold_encode -> cv:<model> ... -> compare
+                  -> encode -> fit (the winner, on every title) -> report
+
+Cross-validation encodes each fold with a feature builder fitted on that
+fold's training titles only; the encoding of every title is only used to
+refit the winner.
+
+Every stage output is cached on disk under a key built from its inputs, code
+and params, so a rerun only recomputes what changed: adding a model
+cross-validates just that model, editing the feature builder re-encodes and
+re-evaluates, and an unchanged run loads everything from the cache.
+
+numpy, pandas, sklearn and the helper modules are imported inside the stages
+and functions that use them, so --help and argument errors return at once.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+DATA_PATH = r"C:\Users\sudsm\Desktop\CodeSoft\CodeSoft Code\Data Science\Data Science Task 2\IMDb Movies India.csv"
+N_SPLITS = 5
+RANDOM_STATE = 42
+
+MODEL_NAMES = [
+    'Linear Regression',
+    'Ridge Regression',
+    'Lasso Regression',
+    'Decision Tree Regressor',
+    'Random Forest Regressor',
+    'Gradient Boosting Regressor',
+    'Hist Gradient Boosting Regressor',
+]
+
+
+def make_models(names=None):
+    """The candidate regressors by name (all of MODEL_NAMES by default)."""
+    from sklearn.linear_model import LinearRegression, Ridge, Lasso
+    from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
+    from sklearn.tree import DecisionTreeRegressor
+
+    models = {
+        'Linear Regression': LinearRegression(),
+        'Ridge Regression': Ridge(random_state=42),
+        'Lasso Regression': Lasso(random_state=42),
+        'Decision Tree Regressor': DecisionTreeRegressor(random_state=42),
+        'Random Forest Regressor': RandomForestRegressor(n_estimators=100, random_state=42),
+        'Gradient Boosting Regressor': GradientBoostingRegressor(n_estimators=100, random_state=42),
+        # Histogram-binned boosting: multi-core, early stopping on a 10% validation split,
+        # and native splits on the categorical director/actor columns of the dense frame
+        'Hist Gradient Boosting Regressor': HistGradientBoostingRegressor(
+            max_iter=500, categorical_features='from_dtype', early_stopping=True,
+            validation_fraction=0.1, n_iter_no_change=20, random_state=42)
+    }
+    return {name: models[name] for name in (names or MODEL_NAMES)}
+
+# Models trained on ImdbFeatureBuilder.transform_frame instead of the sparse matrix
+NATIVE_CATEGORICAL_MODELS = {'Hist Gradient Boosting Regressor'}
+
 
 # --- 1. Data Loading and Initial Inspection ---
 
-# Load the dataset with a specified encoding
-file_path = r"C:\Users\sudsm\Desktop\CodeSoft\CodeSoft Code\Data Science\Data Science Task 2\IMDb Movies India.csv"
-encodings = ['utf-8', 'ISO-8859-1', 'Windows-1252', 'utf-16']
-df = None
+def load_stage(path):
+    from imdb_loading import load_imdb
 
-# Try different encodings to load the dataset
-for enc in encodings:
-    try:
-        df = pd.read_csv(file_path, encoding=enc)
-        print(f"Dataset loaded successfully with encoding: {enc}")
-        break  # Exit the loop if successful
-    except UnicodeDecodeError:
-        print(f"Failed to decode with encoding: {enc}")
-    except FileNotFoundError:
-        print(f"Error: The file '{file_path}' was not found. Please ensure the path is correct.")
-        exit()
-
-# Display initial data info
-print("\n--- Initial Data Info ---")
-df.info()
-print("\n--- First 5 Rows ---")
-print(df.head())
-print("\n--- Missing Values Before Preprocessing ---")
-print(df.isnull().sum())
-
-# --- 2. Data Preprocessing and Feature Engineering ---
-
-# Rename columns for easier access
-df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-df.rename(columns={'actor_1': 'actor1', 'actor_2': 'actor2', 'actor_3': 'actor3'}, inplace=True)
-
-# Convert 'year' to numeric, handling non-numeric values
-df['year'] = pd.to_numeric(df['year'], errors='coerce')
-
-# Check for NaN values in 'year' after conversion
-if df['year'].isnull().all():
-    print("All values in 'year' are NaN after conversion. Please check the data.")
-    exit()
-
-# Fill missing values with the mode if it exists
-year_mode = df['year'].mode()
-if not year_mode.empty:
-    df['year'].fillna(year_mode[0], inplace=True)
-else:
-    print("No mode found for 'year'.")
-    exit()
-
-df['year'] = df['year'].astype(int)  # Convert to integer after filling NaN
-
-# Clean 'duration' column and convert to minutes (numeric)
-def clean_duration(duration_str):
-    if isinstance(duration_str, str):
-        match = re.search(r'(\d+)\s*min', duration_str)
-        if match:
-            return int(match.group(1))
-    return np.nan  # Return NaN for non-string or unmatchable values
-
-df['duration_minutes'] = df['duration'].apply(clean_duration)
-df['duration_minutes'].fillna(df['duration_minutes'].median(), inplace=True)
-
-# Clean 'rating' column and convert to numeric
-df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
-df['rating'].fillna(df['rating'].median(), inplace=True)
-
-# Clean 'votes' column and convert to numeric
-def clean_votes(votes_str):
-    if isinstance(votes_str, str):
-        return int(votes_str.replace(',', ''))
-    return np.nan
-
-df['votes_numeric'] = df['votes'].apply(clean_votes)
-df['votes_numeric'].fillna(df['votes_numeric'].median(), inplace=True)
-
-# Handle 'genre' - Multi-label binarization
-df['genre'] = df['genre'].astype(str).apply(lambda x: [g.strip() for g in x.split(',') if g.strip()])
-mlb_genre = MultiLabelBinarizer()
-genre_encoded = mlb_genre.fit_transform(df['genre'])
-genre_df = pd.DataFrame(genre_encoded, columns=mlb_genre.classes_)
-df = pd.concat([df, genre_df], axis=1)
-
-# Handle 'director' and 'actors' - Label Encoding
-le_director = LabelEncoder()
-df['director_encoded'] = le_director.fit_transform(df['director'].astype(str))
-
-# Actor encoding
-le_actor1 = LabelEncoder()
-le_actor2 = LabelEncoder()
-le_actor3 = LabelEncoder()
-
-df['actor1_encoded'] = le_actor1.fit_transform(df['actor1'].astype(str))
-df['actor2_encoded'] = le_actor2.fit_transform(df['actor2'].astype(str))
-df['actor3_encoded'] = le_actor3.fit_transform(df['actor3'].astype(str))
-
-# Drop original columns that have been processed or are not needed
-columns_to_drop = ['name', 'duration', 'genre', 'director', 'actor1', 'actor2', 'actor3', 'votes', 'all_actors']
-df.drop(columns=columns_to_drop, errors='ignore', inplace=True)
-
-print("\n--- Missing Values After Preprocessing ---")
-print(df.isnull().sum())
-print("\n--- Data Info After Preprocessing ---")
-df.info()
-print("\n--- First 5 Rows After Preprocessing ---")
-print(df.head())
-
-# --- 3. Feature Selection and Data Splitting ---
-
-# Define features (X) and target (y)
-X = df.drop(columns=['rating'])  # 'rating' is our target
-y = df['rating']
-
-# Split data into training and testing sets
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-print(f"\nTraining features shape: {X_train.shape}")
-print(f"Testing features shape: {X_test.shape}")
-print(f"Training target shape: {y_train.shape}")
-print(f"Testing target shape: {y_test.shape}")
-
-# --- 4. Model Training ---
-
-# Initialize and train various regression models
-models = {
-    'Linear Regression': LinearRegression(),
-    'Ridge Regression': Ridge(random_state=42),
-    'Lasso Regression': Lasso(random_state=42),
-    'Decision Tree Regressor': DecisionTreeRegressor(random_state=42),
-    'Random Forest Regressor': RandomForestRegressor(n_estimators=100, random_state=42),
-    'Gradient Boosting Regressor': GradientBoostingRegressor(n_estimators=100, random_state=42)
-}
-
-results = {}
-
-print("\n--- Model Training and Evaluation ---")
-for name, model in models.items():
-    print(f"\nTraining {name}...")
-    model.fit(X_train, y_train)
-    y_pred = model.predict(X_test)
-
-    mse = mean_squared_error(y_test, y_pred)
-    r2 = r2_score(y_test, y_pred)
-
-    results[name] = {'MSE': mse, 'R2': r2}
-
-    print(f"{name} - Mean Squared Error: {mse:.4f}")
-    print(f"{name} - R^2 Score: {r2:.4f}")
+    # The encoding is sniffed from a byte sample (see imdb_loading.py)
+    df = load_imdb(path)
 
-# --- 5. Model Comparison and Selection ---
+    print("\n--- Initial Data Info ---")
+    df.info()
+    print("\n--- First 5 Rows ---")
+    print(df.head())
+    print("\n--- Missing Values Before Preprocessing ---")
+    print(df.isnull().sum())
+    return df
+
+
+# --- 2. Data Preprocessing ---
+
+def clean_stage(df):
+    from imdb_preprocessing import clean_imdb
+
+    # Clean year, duration, rating and votes (vectorized, see imdb_preprocessing.py)
+    df = clean_imdb(df)
+
+    print("\n--- Missing Values After Cleaning ---")
+    print(df.isnull().sum())
+    print("\n--- First 5 Rows After Cleaning ---")
+    print(df.head())
+    return df
+
+
+# --- 3. Feature Encoding and Cross-Validation Folds ---
+
+def encode_stage(df, people_encoding, min_count):
+    from imdb_features import ImdbFeatureBuilder
+
+    # Numeric columns, multi-hot genres and one-hot director/cast in one sparse CSR matrix
+    # (see imdb_features.py; people_encoding='hash' bounds the width for huge catalogs).
+    # Fitted on every title, so it only feeds the final refit, never the CV scores.
+    builder = ImdbFeatureBuilder(people_encoding=people_encoding, min_count=min_count)
+    X = builder.fit_transform(df)
+    y = df['rating'].to_numpy()
+
+    print(f"\nFeature matrix: {X.shape[0]} rows x {X.shape[1]} columns, {X.nnz} non-zeros "
+          f"({(X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 2**20:.1f} MB)")
+    return {'builder': builder, 'X': X, 'X_frame': builder.transform_frame(df), 'y': y}
 
-print("\n--- Model Comparison ---")
-for name, metrics in results.items():
-    print(f"{name}: MSE={metrics['MSE']:.4f}, R2={metrics['R2']:.4f}")
 
-# Select the best model based on R2 score (or MSE)
-best_model_name = max(results, key=lambda k: results[k]['R2'])
-best_model = models[best_model_name]
-print(f"\nBest performing model: {best_model_name} (R2: {results[best_model_name]['R2']:.4f})")
+def features_for(data, name):
+    return data['X_frame'] if name in NATIVE_CATEGORICAL_MODELS else data['X']
 
-# --- 6. Cross-Validation for Robustness (Optional but Recommended) ---
 
-print(f"\n--- Cross-Validation for {best_model_name} ---")
-kf = KFold(n_splits=5, shuffle=True, random_state=42)
-cv_scores = cross_val_score(best_model, X, y, cv=kf, scoring='r2')
+def folds_stage(df, n_splits, random_state):
+    from model_comparison import make_folds
 
-print(f"Cross-validation R^2 scores: {cv_scores}")
-print(f"Mean CV R^2: {np.mean(cv_scores):.4f} (+/- {np.std(cv_scores):.4f})")
+    # Every model is scored on these same folds
+    return make_folds(len(df), n_splits, random_state)
 
-# --- 7. Feature Importance (for tree-based models) ---
 
-if hasattr(best_model, 'feature_importances_'):
-    print(f"\n--- Feature Importances for {best_model_name} ---")
-    feature_importances = pd.Series(best_model.feature_importances_, index=X.columns)
-    print(feature_importances.sort_values(ascending=False).head(10))
+def fold_encode_stage(df, folds, people_encoding, min_count):
+    from imdb_features import ImdbFeatureBuilder
+
+    # One builder per fold, fitted on its training rows only, so the name
+    # vocabulary and min_count cutoffs never see the validation titles
+    encoded = []
+    for train_idx, test_idx in folds:
+        train_df, test_df = df.iloc[train_idx], df.iloc[test_idx]
+        builder = ImdbFeatureBuilder(people_encoding=people_encoding, min_count=min_count).fit(train_df)
+        encoded.append({'X': (builder.transform(train_df), builder.transform(test_df)),
+                        'X_frame': (builder.transform_frame(train_df), builder.transform_frame(test_df))})
+    return {'folds': encoded, 'y': df['rating'].to_numpy()}
+
+
+def feature_keys(names):
+    return {name: 'X_frame' for name in names if name in NATIVE_CATEGORICAL_MODELS}
+
+
+# --- 4. Model Training (K-fold, see model_comparison.py) ---
+
+def cv_stage(encoded, folds, name, model, features):
+    from model_comparison import evaluate_fold_features
+
+    # main() normally batches all uncached models into one evaluate_fold_features call instead
+    return evaluate_fold_features({name: model}, encoded['folds'], encoded['y'], folds,
+                                  feature_keys={name: features})[name]
+
+
+# --- 5. Model Comparison and Selection ---
+
+def compare_stage(*cv_results, names):
+    import numpy as np
+    from model_comparison import comparison_table
+
+    results = dict(zip(names, cv_results))
+    table = comparison_table(results)
+
+    print("\n--- Model Comparison (5-fold CV) ---")
+    print(table.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+    # Select the best model based on mean CV R2
+    best_model_name = table.loc[0, 'model']
+    cv_scores = results[best_model_name]['R2']
+    print(f"\nBest performing model: {best_model_name}")
+    print(f"Cross-validation R^2 scores: {cv_scores}")
+    print(f"Mean CV R^2: {np.mean(cv_scores):.4f} (+/- {np.std(cv_scores):.4f})")
+    return best_model_name
+
+
+def fit_stage(data, name, model):
+    # Refit the winner once on every title for feature importances and new predictions
+    print(f"\nRefitting {name} on all {data['X'].shape[0]} titles...")
+    return model.fit(features_for(data, name), data['y'])
+
+
+# --- 6-8. Feature Importance, Example Prediction, Residual Plot ---
+
+def finish_plot(plt, filename, headless, plots_dir):
+    """Show the current figure, or save it to plots_dir in headless mode."""
+    if headless:
+        plots_dir = Path(plots_dir)
+        plots_dir.mkdir(parents=True, exist_ok=True)
+        plt.savefig(plots_dir / filename)
+        plt.close()
+        print(f"Saved plot to {plots_dir / filename}")
+    else:
+        plt.show()
+
+
+def report_stage(df, data, cv_result, best_model, name, headless, plots_dir):
+    if headless:
+        import matplotlib
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    if hasattr(best_model, 'feature_importances_'):
+        print(f"\n--- Feature Importances for {name} ---")
+        feature_importances = pd.Series(best_model.feature_importances_, index=data['builder'].feature_names_)
+        print(feature_importances.sort_values(ascending=False).head(10))
+
+        plt.figure(figsize=(10, 6))
+        feature_importances.sort_values(ascending=False).head(10).plot(kind='bar')
+        plt.title('Top 10 Feature Importances')
+        plt.ylabel('Importance')
+        plt.tight_layout()
+        finish_plot(plt, 'feature_importances.png', headless, plots_dir)
+
+    # The out-of-fold prediction for a title comes from a model that never saw it
+    print("\n--- Example Prediction on New Data ---")
+    actual_rating = df['rating'].iloc[0]
+    predicted_rating_example = cv_result['oof'][0]
+    print(f"Actual Rating for a sample movie: {actual_rating:.2f}")
+    print(f"Predicted Rating for the same sample movie: {predicted_rating_example:.2f}")
+    print(f"Difference: {abs(actual_rating - predicted_rating_example):.2f}")
 
     plt.figure(figsize=(10, 6))
-    feature_importances.sort_values(ascending=False).head(10).plot(kind='bar')
-    plt.title('Top 10 Feature Importances')
-    plt.ylabel('Importance')
-    plt.tight_layout()
-    plt.show()
-
-# --- 8. Prediction on New Data (Example) ---
-
-print("\n--- Example Prediction on New Data ---")
-
-# Create a sample new movie data point
-# Note: The new data must have the same columns as X_train after preprocessing
-# and encoding. This is a simplified example. In a real application, you'd
-# need to apply the same preprocessing steps and encoders used during training.
-
-# For demonstration, let's create a dummy row similar to X_train structure
-# This assumes you know the encoded values for new director/actors/genres.
-# In a real scenario, you'd use the fitted LabelEncoders and MultiLabelBinarizer.
-
-# Example: A new movie 'The Great Adventure'
-# Genre: Action, Adventure
-# Director: 'Christopher Nolan' (if in training data, else 'Other' or new encoding)
-# Actor1: 'Leonardo DiCaprio', Actor2: 'Tom Hardy', Actor3: 'Joseph Gordon-Levitt'
-
-# To make a realistic prediction, we need to reverse the preprocessing for a new input.
-# This is complex for a single example without a full pipeline for new data.
-# Instead, let's predict for an existing row from the test set to show functionality.
-
-# Let's pick the first row from the original test set (before dropping columns)
-original_test_row = df.iloc[X_test.index[0]]
-actual_rating = original_test_row['rating']
-new_movie_features = X_test.iloc[[0]]  # Get the features for this row
-
-predicted_rating_example = best_model.predict(new_movie_features)[0]
-
-print(f"Actual Rating for a sample movie: {actual_rating:.2f}")
-print(f"Predicted Rating for the same sample movie: {predicted_rating_example:.2f}")
-print(f"Difference: {abs(actual_rating - predicted_rating_example):.2f}")
-
-# --- 9. Residual Plot (Optional) ---
-plt.figure(figsize=(10, 6))
-sns.residplot(x=y_test, y=y_pred, lowess=True, color='green')
-plt.xlabel("Actual Ratings")
-plt.ylabel("Residuals")
-plt.title("Residual Plot")
-plt.grid(True)
-plt.show()
+    sns.residplot(x=data['y'], y=cv_result['oof'], lowess=True, color='green')
+    plt.xlabel("Actual Ratings")
+    plt.ylabel("Residuals")
+    plt.title("Residual Plot (out-of-fold predictions)")
+    plt.grid(True)
+    finish_plot(plt, 'residuals.png', headless, plots_dir)
+
+
+def build_graph(args, models):
+    import imdb_features
+    import imdb_loading
+    import imdb_preprocessing
+    from model_comparison import collect, evaluate_fold_features, fit_split, make_folds, share
+    from stage_cache import StageGraph
+
+    names = list(models)
+    graph = StageGraph(cache_dir=args.cache_dir, force=args.force)
+    data_path = str(Path(args.data).resolve())
+    graph.add('load', load_stage, params={'path': data_path}, files=[data_path], code=[imdb_loading])
+    graph.add('clean', clean_stage, inputs=['load'], code=[imdb_preprocessing])
+    graph.add('encode', encode_stage, inputs=['clean'],
+              params={'people_encoding': args.people_encoding, 'min_count': 2},
+              code=[imdb_features, imdb_preprocessing])
+    graph.add('folds', folds_stage, inputs=['clean'],
+              params={'n_splits': N_SPLITS, 'random_state': RANDOM_STATE}, code=[make_folds])
+    graph.add('fold_encode', fold_encode_stage, inputs=['clean', 'folds'],
+              params={'people_encoding': args.people_encoding, 'min_count': 2},
+              code=[imdb_features, imdb_preprocessing])
+    # main() fills the cv stages through evaluate_fold_features, so the key covers every
+    # function on that path; the model enters through its estimator params and its feature set
+    for name in names:
+        graph.add(f'cv:{name}', cv_stage, inputs=['fold_encode', 'folds'],
+                  params={'name': name, 'model': models[name], 'features': feature_keys([name]).get(name, 'X')},
+                  code=[evaluate_fold_features, fit_split, collect, share, feature_keys])
+    graph.add('compare', compare_stage, inputs=[f'cv:{name}' for name in names],
+              params={'names': names}, cache=False)
+    return graph
+
+
+def main(args):
+    if not Path(args.data).exists():
+        print(f"Error: The file '{args.data}' was not found. Please ensure the path is correct.")
+        return
+
+    from imdb_preprocessing import NoUsableDataError
+    from model_comparison import evaluate_fold_features
+
+    models = make_models(args.models)
+    names = list(models)
+    graph = build_graph(args, models)
+    missing = [name for name in names if not graph.is_cached(f'cv:{name}')]
+    try:
+        if missing:
+            # Cross-validate all uncached models in one parallel batch over (model, fold) pairs
+            encoded, folds = graph.run('fold_encode'), graph.run('folds')
+            print(f"\n--- Model Training and Evaluation: {', '.join(missing)} ---")
+            results = evaluate_fold_features({name: models[name] for name in missing}, encoded['folds'],
+                                             encoded['y'], folds, n_jobs=args.n_jobs,
+                                             feature_keys=feature_keys(missing))
+            for name in missing:
+                graph.store(f'cv:{name}', results[name])
+        best_name = graph.run('compare')
+    except NoUsableDataError as e:
+        print(e)
+        sys.exit(1)
+
+    # The winner is only known now, so the stages that depend on it are added last
+    graph.add('fit', fit_stage, inputs=['encode'], params={'name': best_name, 'model': models[best_name]},
+              code=[features_for])
+    graph.add('report', report_stage, inputs=['clean', 'encode', f'cv:{best_name}', 'fit'],
+              params={'name': best_name, 'headless': args.headless, 'plots_dir': args.plots_dir},
+              cache=False)
+    graph.run('report')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="IMDb Movies India rating prediction")
+    parser.add_argument("--data", type=str, default=DATA_PATH, help="Path to 'IMDb Movies India.csv'")
+    parser.add_argument("--cache-dir", type=str, default=".stage_cache", help="Directory for cached stage outputs")
+    parser.add_argument("--force", action="store_true", help="Recompute every stage, ignoring the cache")
+    parser.add_argument("--models", nargs="+", choices=MODEL_NAMES, help="Subset of models to train")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Worker processes for cross-validation")
+    parser.add_argument("--people-encoding", choices=["onehot", "hash"], default="onehot",
+                        help="How director/actor names are encoded")
+    parser.add_argument("--headless", action="store_true", help="Write plots to files instead of showing them")
+    parser.add_argument("--plots-dir", type=str, default="plots", help="Where headless plots are written")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(parse_args())
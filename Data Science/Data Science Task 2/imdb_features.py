@@ -0,0 +1,122 @@
+# imdb_features.py
+"""Sparse feature matrix for the cleaned IMDb data.
+
+ImdbFeatureBuilder turns the output of imdb_preprocessing.clean_imdb into one
+SciPy CSR matrix:
+
+    [numeric columns | multi-hot genres | director columns | actor columns]
+
+Directors and actors are either one-hot encoded over the names seen at least
+`min_count` times in the training data (everything else shares an '__other__'
+column), or hashed into a fixed number of columns. The three actor columns
+share one block, so a title gets a 1 for each actor in its cast no matter the
+billing position.
+
+transform_frame gives the same information as a small dense DataFrame for
+histogram gradient boosting: genres stay multi-hot, while the director and
+each actor column become pandas categoricals over the most frequent names
+(at most `max_categories`, rarer names are missing), so the model can split
+on them natively instead of on one-hot or label-encoded columns.
+"""
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from imdb_preprocessing import genre_classes, genre_matrix
+
+NUMERIC_COLUMNS = ['year', 'duration_minutes', 'votes_numeric']
+DIRECTOR_COLUMNS = ['director']
+ACTOR_COLUMNS = ['actor1', 'actor2', 'actor3']
+OTHER = '__other__'
+
+
+def stack_values(df, columns):
+    """Return (row positions, values) for the non-missing entries of the given columns."""
+    rows, values = [], []
+    for col in columns:
+        col_values = df[col].to_numpy(dtype=object)
+        present = pd.notna(col_values)
+        rows.append(np.flatnonzero(present))
+        values.append(col_values[present])
+    return np.concatenate(rows), np.concatenate(values)
+
+
+class ImdbFeatureBuilder:
+    """Fit on the training rows, then transform any frame to a CSR matrix."""
+
+    def __init__(self, people_encoding='onehot', min_count=2, n_hash_features=2**16,
+                 numeric_columns=NUMERIC_COLUMNS, dtype=np.float32, max_categories=255):
+        if people_encoding not in ('onehot', 'hash'):
+            raise ValueError("people_encoding must be 'onehot' or 'hash'")
+        self.people_encoding = people_encoding
+        self.min_count = min_count
+        self.n_hash_features = n_hash_features
+        self.numeric_columns = list(numeric_columns)
+        self.dtype = dtype
+        self.max_categories = max_categories
+
+    def fit(self, df):
+        self.genres_ = np.array(genre_classes(df['genre']), dtype=object)
+        self.vocabularies_ = {}
+        if self.people_encoding == 'onehot':
+            for block, columns in (('director', DIRECTOR_COLUMNS), ('actor', ACTOR_COLUMNS)):
+                _, names = stack_values(df, columns)
+                counts = pd.Series(names).value_counts()
+                kept = np.sort(counts.index[counts >= self.min_count].to_numpy(dtype=object))
+                self.vocabularies_[block] = np.append(kept, OTHER).astype(object)
+        self.top_names_ = {}
+        for block, columns in (('director', DIRECTOR_COLUMNS), ('actor', ACTOR_COLUMNS)):
+            _, names = stack_values(df, columns)
+            self.top_names_[block] = pd.Series(names).value_counts().index[:self.max_categories].to_numpy(dtype=object)
+        self.feature_names_ = self._feature_names()
+        return self
+
+    def _block_width(self, block):
+        if self.people_encoding == 'hash':
+            return self.n_hash_features
+        return len(self.vocabularies_[block])
+
+    def _feature_names(self):
+        names = list(self.numeric_columns) + [f'genre_{g}' for g in self.genres_]
+        for block in ('director', 'actor'):
+            if self.people_encoding == 'hash':
+                names += [f'{block}_hash_{i}' for i in range(self.n_hash_features)]
+            else:
+                names += [f'{block}_{v}' for v in self.vocabularies_[block]]
+        return np.array(names, dtype=object)
+
+    def _people_block(self, df, block, columns):
+        rows, names = stack_values(df, columns)
+        if self.people_encoding == 'hash':
+            cols = (pd.util.hash_array(names) % np.uint64(self.n_hash_features)).astype(np.int64)
+        else:
+            vocab = self.vocabularies_[block]
+            cols = pd.Categorical(names, categories=vocab).codes.astype(np.int64)
+            cols[cols < 0] = len(vocab) - 1  # unseen or rare -> '__other__'
+        ones = np.ones(len(rows), dtype=self.dtype)
+        block_matrix = sp.csr_matrix((ones, (rows, cols)), shape=(len(df), self._block_width(block)))
+        block_matrix.sum_duplicates()
+        return block_matrix
+
+    def transform(self, df):
+        blocks = [
+            sp.csr_matrix(df[self.numeric_columns].to_numpy(dtype=self.dtype)),
+            genre_matrix(df['genre'], self.genres_, dtype=self.dtype),
+            self._people_block(df, 'director', DIRECTOR_COLUMNS),
+            self._people_block(df, 'actor', ACTOR_COLUMNS),
+        ]
+        return sp.hstack(blocks, format='csr', dtype=self.dtype)
+
+    def transform_frame(self, df):
+        """Dense frame with native categorical director/actor columns (see module docstring)."""
+        frame = pd.DataFrame(df[self.numeric_columns].to_numpy(dtype=self.dtype), columns=self.numeric_columns)
+        genres = genre_matrix(df['genre'], self.genres_, dtype=np.uint8).toarray()
+        frame[[f'genre_{g}' for g in self.genres_]] = genres
+        for block, columns in (('director', DIRECTOR_COLUMNS), ('actor', ACTOR_COLUMNS)):
+            dtype = pd.CategoricalDtype(self.top_names_[block])
+            for col in columns:
+                frame[col] = pd.Categorical(df[col].to_numpy(dtype=object), dtype=dtype)
+        return frame
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
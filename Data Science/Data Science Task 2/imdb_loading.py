@@ -0,0 +1,116 @@
+# imdb_loading.py
+"""Encoding detection and typed (optionally chunked) loading of the IMDb CSV.
+
+The encoding is guessed once from a bounded byte sample instead of parsing the
+whole file for every candidate encoding. Columns are read with explicit dtypes:
+the repetitive text columns become categoricals, which is where most of the
+memory of a default object-dtype load goes.
+"""
+import codecs
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "common"))
+from chunked_frames import concat_chunks  # noqa: E402
+
+ENCODINGS = ['utf-8', 'ISO-8859-1', 'Windows-1252', 'utf-16']
+SAMPLE_BYTES = 1 << 20
+SAMPLE_WINDOWS = 8
+
+# 'Name' is dropped by the pipeline, so it is not read by default
+USECOLS = ['Year', 'Duration', 'Genre', 'Rating', 'Votes', 'Director', 'Actor 1', 'Actor 2', 'Actor 3']
+DTYPES = {
+    'Name': 'string',
+    'Year': 'category',
+    'Duration': 'category',
+    'Genre': 'category',
+    'Rating': 'float32',
+    'Votes': 'string',
+    'Director': 'category',
+    'Actor 1': 'category',
+    'Actor 2': 'category',
+    'Actor 3': 'category',
+}
+
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def read_sample(path, sample_bytes=SAMPLE_BYTES, windows=SAMPLE_WINDOWS):
+    """Return the head of the file plus evenly spaced windows, at most sample_bytes in total."""
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        if size <= sample_bytes:
+            return [f.read()]
+        window = sample_bytes // windows
+        chunks = []
+        for i in range(windows):
+            f.seek(i * (size - window) // (windows - 1))
+            chunks.append(f.read(window))
+        return chunks
+
+
+def decodes(chunk, encoding, is_head):
+    """True if chunk decodes with encoding, ignoring characters cut at the window edges."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    if not is_head and encoding == 'utf-8':
+        # skip continuation bytes of a character split by the window start
+        chunk = chunk.lstrip(bytes(range(0x80, 0xC0)))
+    try:
+        decoder.decode(chunk, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def sniff_encoding(path, encodings=ENCODINGS, sample_bytes=SAMPLE_BYTES):
+    """Guess the file encoding from a BOM or from a bounded byte sample."""
+    chunks = read_sample(path, sample_bytes)
+    for bom, encoding in BOMS:
+        if chunks[0].startswith(bom):
+            return encoding
+    for encoding in encodings:
+        if all(decodes(chunk, encoding, i == 0) for i, chunk in enumerate(chunks)):
+            return encoding
+    raise UnicodeDecodeError('sniff', chunks[0][:1], 0, 1, f"none of {encodings} match the sample")
+
+
+def read_csv_typed(path, encoding, usecols=USECOLS, chunksize=None):
+    dtype = {col: DTYPES[col] for col in usecols if col in DTYPES}
+    return pd.read_csv(path, encoding=encoding, usecols=usecols, dtype=dtype, chunksize=chunksize)
+
+
+def iter_imdb_chunks(path, chunksize=100_000, usecols=USECOLS, encoding=None):
+    """Stream the CSV as typed DataFrame chunks of at most chunksize rows."""
+    encoding = encoding or sniff_encoding(path)
+    with read_csv_typed(path, encoding, usecols, chunksize) as reader:
+        yield from reader
+
+
+def load_imdb(path, usecols=USECOLS, encoding=None, chunksize=None):
+    """Load the IMDb CSV with a sniffed encoding and explicit dtypes.
+
+    With chunksize set the file is parsed chunk by chunk, so only one chunk of
+    raw strings is alive at a time. If the sniffed encoding turns out to be
+    wrong (a bad byte outside the sample), the next candidate is tried.
+    """
+    guessed = encoding or sniff_encoding(path)
+    candidates = [guessed] + [enc for enc in ENCODINGS if enc != guessed and encoding is None]
+    for enc in candidates:
+        try:
+            if chunksize:
+                df = concat_chunks(iter_imdb_chunks(path, chunksize, usecols, enc))
+            else:
+                df = read_csv_typed(path, enc, usecols)
+        except UnicodeDecodeError:
+            print(f"Failed to decode with encoding: {enc}")
+            continue
+        print(f"Dataset loaded successfully with encoding: {enc}")
+        return df
+    raise UnicodeDecodeError('load', b'', 0, 1, f"none of {candidates} could decode {path}")
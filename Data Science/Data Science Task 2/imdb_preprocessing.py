@@ -0,0 +1,122 @@
+# imdb_preprocessing.py
+"""Vectorized cleaning stage for the IMDb Movies India dataset.
+
+Shared by ds_task_2.py and ds_task_4.py. Every step works on whole columns
+with pandas string/regex methods instead of calling Python functions per row.
+Raw IMDb columns repeat the same strings a lot ('120 min', 'Drama, Romance'),
+so each cleaner factorizes the column first and only parses the distinct values.
+"""
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+DURATION_PATTERN = r'(\d+)\s*min'
+YEAR_PATTERN = r'(\d{4})'
+
+
+class NoUsableDataError(ValueError):
+    """The file was read but a column the model needs has no usable value."""
+
+
+def on_uniques(series, clean):
+    """Apply a vectorized cleaner to the distinct values of series and broadcast back."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    cleaned = clean(pd.Series(uniques, dtype=object)).to_numpy()
+    return pd.Series(cleaned[codes], index=series.index)
+
+
+def normalize_columns(df):
+    """Lower-case/underscore the column names and shorten the actor columns."""
+    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+    return df.rename(columns={'actor_1': 'actor1', 'actor_2': 'actor2', 'actor_3': 'actor3'})
+
+
+def clean_year(year):
+    """Pull the four digit year out of values like '(2019)' or '(1995 II)'."""
+    extracted = on_uniques(year, lambda u: u.astype('string').str.extract(YEAR_PATTERN, expand=False))
+    return pd.to_numeric(extracted, errors='coerce')
+
+
+def clean_duration(duration):
+    """Convert '109 min' style strings to minutes; anything else becomes NaN."""
+    def parse(u):
+        extracted = u.astype('string').str.extract(DURATION_PATTERN, expand=False)
+        return pd.to_numeric(extracted, errors='coerce').astype('float64')
+    return on_uniques(duration, parse)
+
+
+def clean_votes(votes):
+    """Convert '1,086' style strings to numbers; unparseable values become NaN."""
+    def parse(u):
+        stripped = u.astype('string').str.replace(',', '', regex=False)
+        return pd.to_numeric(stripped, errors='coerce').astype('float64')
+    return on_uniques(votes, parse)
+
+
+def explode_genres(genre):
+    """Return a (row position, genre) frame with one row per listed genre.
+
+    Missing values and empty items (e.g. ' , Drama') contribute no genres.
+    """
+    parts = genre.astype('string').str.split(',')
+    parts.index = np.arange(len(parts))
+    items = parts.explode().str.strip()
+    items = items[items.notna() & (items != '')]
+    return pd.DataFrame({'row': items.index.to_numpy(), 'genre': items.to_numpy(dtype=object)})
+
+
+def genre_classes(genre):
+    """Sorted list of the distinct genres appearing in the column."""
+    _, combos = pd.factorize(genre)
+    return sorted(explode_genres(pd.Series(combos, dtype=object))['genre'].unique())
+
+
+def genre_matrix(genre, classes, dtype=np.int64):
+    """Multi-hot encode a comma separated genre column as a CSR matrix.
+
+    Column j is classes[j]; genres not in classes are ignored. Each distinct
+    genre string is split once and its row is copied to every title using it.
+    """
+    row_codes, combos = pd.factorize(genre, use_na_sentinel=False)
+    pairs = explode_genres(pd.Series(combos, dtype=object))
+    codes = pd.Categorical(pairs['genre'], categories=classes).codes
+    known = codes >= 0
+    combo_matrix = sp.csr_matrix(
+        (np.ones(known.sum(), dtype=dtype), (pairs['row'].to_numpy()[known], codes[known])),
+        shape=(len(combos), len(classes)),
+    )
+    return combo_matrix[row_codes]
+
+
+def genre_dummies(genre):
+    """Multi-hot encode a comma separated genre column.
+
+    Produces the same matrix as MultiLabelBinarizer on the per-row stripped
+    lists: one int64 column per genre, columns sorted, index 0..n-1.
+    """
+    classes = genre_classes(genre)
+    return pd.DataFrame(genre_matrix(genre, classes).toarray(), columns=classes)
+
+
+def fill_median(series):
+    return series.fillna(series.median())
+
+
+def clean_imdb(df):
+    """Run the column cleaning stage and return a new DataFrame.
+
+    Adds 'duration_minutes' and 'votes_numeric', converts 'year' and 'rating'
+    to numbers, and fills their gaps (mode for year, median for the rest).
+    Raises NoUsableDataError if no usable year is found.
+    """
+    df = normalize_columns(df.copy())
+
+    df['year'] = clean_year(df['year'])
+    if df['year'].isnull().all():
+        raise NoUsableDataError("All values in 'year' are NaN after conversion. Please check the data.")
+    df['year'] = df['year'].fillna(df['year'].mode()[0]).astype(int)
+
+    df['duration_minutes'] = fill_median(clean_duration(df['duration']))
+    df['rating'] = fill_median(pd.to_numeric(df['rating'], errors='coerce'))
+    df['votes_numeric'] = fill_median(clean_votes(df['votes']))
+    return df
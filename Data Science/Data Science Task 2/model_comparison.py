@@ -0,0 +1,154 @@
+# model_comparison.py
+"""Parallel K-fold comparison of regressors on shared feature matrices.
+
+The feature matrices are dumped once to a temporary folder and memory-mapped
+back, so every worker process reads the same pages instead of receiving its
+own pickled copy (this works for dense arrays and for the data/indices/indptr
+arrays of a CSR matrix). Each (model, fold) pair is a separate job, all
+models see the same folds, and the out-of-fold predictions are kept so the
+winner's residuals can be plotted without refitting.
+
+evaluate_models slices one matrix built from every row; evaluate_fold_features
+takes features that were fitted on each fold's training rows, for encoders
+whose vocabulary must not see the validation rows.
+"""
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import KFold
+
+
+def make_folds(n_rows, n_splits=5, random_state=42):
+    """Return a list of (train_idx, test_idx) pairs shared by every model."""
+    kf = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    return list(kf.split(np.arange(n_rows)))
+
+
+def share(X, folder, stem):
+    """Dump X to folder and return a read-only memory-mapped view of it."""
+    path = Path(folder) / f"{stem}.joblib"
+    joblib.dump(X, path)
+    return joblib.load(path, mmap_mode='r')
+
+
+def take_rows(X, idx):
+    return X.iloc[idx] if isinstance(X, pd.DataFrame) else X[idx]
+
+
+def fit_split(name, model, X_train, y_train, X_test, fold):
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    y_pred = model.predict(X_test)
+    predict_time = time.perf_counter() - start
+    return name, fold, y_pred, fit_time, predict_time
+
+
+def fit_fold(name, model, X, y, fold, train_idx, test_idx):
+    return fit_split(name, model, take_rows(X, train_idx), y[train_idx], take_rows(X, test_idx), fold)
+
+
+def collect(names, outputs, y, folds):
+    """Gather (name, fold, y_pred, fit_time, predict_time) job outputs into per-model results."""
+    results = {name: {'oof': np.full(len(y), np.nan), 'R2': np.zeros(len(folds)), 'MSE': np.zeros(len(folds)),
+                      'fit_time': np.zeros(len(folds)), 'predict_time': np.zeros(len(folds))}
+               for name in names}
+    for name, fold, y_pred, fit_time, predict_time in outputs:
+        test_idx = folds[fold][1]
+        r = results[name]
+        r['oof'][test_idx] = y_pred
+        r['R2'][fold] = r2_score(y[test_idx], y_pred)
+        r['MSE'][fold] = mean_squared_error(y[test_idx], y_pred)
+        r['fit_time'][fold] = fit_time
+        r['predict_time'][fold] = predict_time
+    return results
+
+
+def evaluate_models(models, X, y, folds, n_jobs=-1, feature_sets=None):
+    """Cross-validate every model on the same folds, in parallel over (model, fold) pairs.
+
+    models maps name -> unfitted estimator. feature_sets optionally maps a
+    model name to its own feature matrix or DataFrame (same rows as X), e.g.
+    the dense categorical frame used by histogram gradient boosting. Returns a dict
+    name -> {'oof': out-of-fold predictions, 'R2': per-fold R2, 'MSE':
+    per-fold MSE, 'fit_time': per-fold seconds, 'predict_time': per-fold seconds}.
+    """
+    y = np.asarray(y)
+    feature_sets = feature_sets or {}
+    folder = tempfile.mkdtemp(prefix="model_comparison_")
+    try:
+        shared = {None: share(X, folder, "X")}
+        for name, X_own in feature_sets.items():
+            shared[name] = share(X_own, folder, f"X_{len(shared)}")
+
+        jobs = (
+            delayed(fit_fold)(name, clone(model), shared[name if name in shared else None], y, fold, train_idx, test_idx)
+            for name, model in models.items()
+            for fold, (train_idx, test_idx) in enumerate(folds)
+        )
+        outputs = Parallel(n_jobs=n_jobs)(jobs)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return collect(models, outputs, y, folds)
+
+
+def evaluate_fold_features(models, fold_features, y, folds, n_jobs=-1, feature_keys=None):
+    """Cross-validate every model on features fitted inside each fold.
+
+    fold_features holds one dict per fold mapping a feature-set key to the
+    (X_train, X_test) pair of that fold, built from its training rows only.
+    Models use the 'X' set unless feature_keys maps their name to another key.
+    Returns the same dict as evaluate_models.
+    """
+    y = np.asarray(y)
+    feature_keys = feature_keys or {}
+    used = {feature_keys.get(name, 'X') for name in models}
+    folder = tempfile.mkdtemp(prefix="model_comparison_")
+    try:
+        shared = [{key: tuple(share(X, folder, f"{key}_{fold}_{part}") for X, part in zip(sets[key], ("train", "test")))
+                   for key in used}
+                  for fold, sets in enumerate(fold_features)]
+        jobs = (
+            delayed(fit_split)(name, clone(model), shared[fold][key][0], y[train_idx], shared[fold][key][1], fold)
+            for name, model in models.items()
+            for key in [feature_keys.get(name, 'X')]
+            for fold, (train_idx, _) in enumerate(folds)
+        )
+        outputs = Parallel(n_jobs=n_jobs)(jobs)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return collect(models, outputs, y, folds)
+
+
+def comparison_table(results):
+    """One row per model, best mean CV R2 first."""
+    rows = [{
+        'model': name,
+        'cv_r2_mean': r['R2'].mean(),
+        'cv_r2_std': r['R2'].std(),
+        'cv_mse_mean': r['MSE'].mean(),
+        'fit_time_s': r['fit_time'].mean(),
+        'predict_time_s': r['predict_time'].mean(),
+    } for name, r in results.items()]
+    return pd.DataFrame(rows).sort_values('cv_r2_mean', ascending=False).reset_index(drop=True)
+
+
+def compare_models(models, X, y, n_splits=5, random_state=42, n_jobs=-1, feature_sets=None):
+    """Evaluate all models on shared folds and pick the winner by mean CV R2.
+
+    Returns (table, best_name, results, folds).
+    """
+    folds = make_folds(len(y), n_splits, random_state)
+    results = evaluate_models(models, X, y, folds, n_jobs=n_jobs, feature_sets=feature_sets)
+    table = comparison_table(results)
+    return table, table.loc[0, 'model'], results, folds
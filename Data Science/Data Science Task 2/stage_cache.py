@@ -0,0 +1,131 @@
+# stage_cache.py
+"""A small on-disk memoized stage graph for the task scripts.
+
+Each stage is a function of the outputs of its input stages plus keyword
+params. Its cache key hashes:
+
+- the source code of the function and of any extra `code` it depends on,
+- the params (via joblib.hash, so estimators and arrays work),
+- the size and mtime of any input `files`,
+- the keys of its input stages.
+
+Keys are computed without running anything, so a stage whose key is already
+on disk is loaded directly and its upstream stages are never evaluated. The
+last `keep` keys of every stage stay on disk (least recently used go first),
+so switching params back and forth does not recompute either side.
+"""
+import hashlib
+import inspect
+import os
+import time
+from pathlib import Path
+
+import joblib
+
+
+class Stage:
+    def __init__(self, name, func, inputs=(), params=None, files=(), code=(), cache=True):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.params = params or {}
+        self.files = list(files)
+        self.code = list(code)
+        self.cache = cache
+
+
+def source_hash(obj):
+    try:
+        source = inspect.getsource(obj)
+    except (OSError, TypeError):
+        source = repr(obj)
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class StageGraph:
+    def __init__(self, cache_dir=".stage_cache", force=False, verbose=True, keep=3):
+        self.cache_dir = Path(cache_dir)
+        self.force = force
+        self.keep = keep
+        self.verbose = verbose
+        self.stages = {}
+        self._keys = {}
+        self._values = {}
+
+    def add(self, name, func, inputs=(), params=None, files=(), code=(), cache=True):
+        for dep in inputs:
+            if dep not in self.stages:
+                raise KeyError(f"Stage '{name}' depends on unknown stage '{dep}'")
+        self.stages[name] = Stage(name, func, inputs, params, files, code, cache)
+        return name
+
+    def key(self, name):
+        if name not in self._keys:
+            stage = self.stages[name]
+            h = hashlib.sha256(name.encode())
+            for obj in [stage.func] + stage.code:
+                h.update(source_hash(obj).encode())
+            h.update(joblib.hash(stage.params).encode())
+            for path in stage.files:
+                h.update(file_fingerprint(path).encode())
+            for dep in stage.inputs:
+                h.update(self.key(dep).encode())
+            self._keys[name] = h.hexdigest()[:16]
+        return self._keys[name]
+
+    def cache_path(self, name):
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+        return self.cache_dir / f"{safe}-{self.key(name)}.joblib"
+
+    def is_cached(self, name):
+        if name in self._values:
+            return True
+        return self.stages[name].cache and not self.force and self.cache_path(name).exists()
+
+    def store(self, name, value):
+        """Record a value computed outside run() (e.g. in a batch) as the output of a stage."""
+        path = self.cache_path(name)
+        if self.stages[name].cache:
+            self._write(path, value)
+        self._values[name] = value
+
+    def _write(self, path, value):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        safe = path.stem.rsplit('-', 1)[0]
+        older = [p for p in self.cache_dir.glob(f"{safe}-*.joblib") if p.stem.rsplit('-', 1)[0] == safe and p != path]
+        older.sort(key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in older[self.keep - 1:]:
+            stale.unlink()
+        joblib.dump(value, path)
+
+    def run(self, name):
+        """Return the output of a stage, loading it from disk or computing it (and its inputs)."""
+        if name in self._values:
+            return self._values[name]
+        stage = self.stages[name]
+        path = self.cache_path(name)
+
+        if stage.cache and not self.force and path.exists():
+            value = joblib.load(path)
+            path.touch()  # most recently used, for the pruning in _write
+            self._log(f"{name}: loaded from cache")
+        else:
+            args = [self.run(dep) for dep in stage.inputs]
+            start = time.perf_counter()
+            value = stage.func(*args, **stage.params)
+            elapsed = time.perf_counter() - start
+            if stage.cache:
+                self._write(path, value)
+            self._log(f"{name}: computed in {elapsed:.2f}s")
+
+        self._values[name] = value
+        return value
+
+    def _log(self, message):
+        if self.verbose:
+            print(f"[stage] {message}")
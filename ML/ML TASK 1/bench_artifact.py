@@ -0,0 +1,112 @@
+# bench_artifact.py
+"""Pickled pipeline vs compact artifact: size on disk, load time and batch throughput.
+
+Uses an existing best_model.pkl when given, otherwise trains the TF-IDF
+pipeline on a synthetic corpus the size of the real dataset. Cold load time
+is measured in a fresh interpreter, so it includes the imports each format
+needs (sklearn for the pickle, numpy only for a TF-IDF artifact).
+"""
+import argparse
+import io
+import json
+import pickle
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from genre_artifact import GenrePredictor, artifact_size, export_artifact
+from genre_data import load_genre_frame
+from genre_synth import write_corpus
+from genre_training import make_classifiers, make_pipeline, make_vectorizer
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import best_of  # noqa: E402
+
+REAL_ROWS = 54_214
+DATA_DIR = Path(__file__).resolve().parents[2] / "benchmarks" / "bench_data"
+
+LOADERS = {
+    "pickle": "import pickle; pickle.load(open({path!r}, 'rb'))['pipeline']",
+    "artifact": "from genre_artifact import GenrePredictor; GenrePredictor.load({path!r})",
+}
+
+
+def train_pipeline(corpus, model):
+    df = load_genre_frame(corpus)
+    vectorizer = make_vectorizer()
+    X = vectorizer.fit_transform(df["description"].to_numpy(dtype=object))
+    clf = make_classifiers()[model].fit(X, df["genre"].to_numpy(dtype=object))
+    return make_pipeline(vectorizer, clf), df["description"].to_numpy(dtype=object)
+
+
+def zipped_size(path):
+    path = Path(path)
+    files = sorted(path.iterdir()) if path.is_dir() else [path]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        for f in files:
+            z.write(f, arcname=f.name)
+    return buffer.tell()
+
+
+def cold_load(kind, path, repeats=3):
+    code = ("import time; start = time.perf_counter(); " + LOADERS[kind].format(path=str(path))
+            + "; print(time.perf_counter() - start)")
+    runs = [float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                 cwd=Path(__file__).parent).stdout) for _ in range(repeats)]
+    return min(runs)
+
+
+def main(args):
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    corpus = Path(args.corpus)
+    if not corpus.exists():
+        print(f"Generating {corpus} ({REAL_ROWS:,} records)...")
+        write_corpus(corpus, REAL_ROWS)
+    if args.model:
+        with open(args.model, "rb") as f:
+            pipeline = pickle.load(f)["pipeline"]
+        texts = load_genre_frame(corpus)["description"].to_numpy(dtype=object)
+        pickle_path = Path(args.model)
+    else:
+        print(f"Training {args.classifier} on {corpus}...")
+        pipeline, texts = train_pipeline(corpus, args.classifier)
+        pickle_path = out / "best_model.pkl"
+        with open(pickle_path, "wb") as f:
+            pickle.dump({"pipeline": pipeline}, f)
+    artifact_dir = export_artifact(pipeline, out / "artifact")
+    batch = list(texts[:args.batch])
+
+    predictor, warm_artifact = best_of(lambda: GenrePredictor.load(artifact_dir))
+    _, warm_pickle = best_of(lambda: pickle.load(open(pickle_path, "rb")))
+    ref, pipe_seconds = best_of(lambda: pipeline.predict(batch))
+    top, artifact_seconds = best_of(lambda: predictor.predict_top_k(batch, k=3))
+    agree = np.mean([row[0][0] == label for row, label in zip(top, ref)])
+
+    rows = [
+        ("size on disk (KB)", pickle_path.stat().st_size / 1024, artifact_size(artifact_dir) / 1024),
+        ("zipped size (KB)", zipped_size(pickle_path) / 1024, zipped_size(artifact_dir) / 1024),
+        ("cold load incl. imports (ms)", cold_load("pickle", pickle_path) * 1000, cold_load("artifact", artifact_dir) * 1000),
+        ("warm load (ms)", warm_pickle * 1000, warm_artifact * 1000),
+        (f"batch of {len(batch):,} (docs/s)", len(batch) / pipe_seconds, len(batch) / artifact_seconds),
+    ]
+    print(f"\n{'':<30}{'pickle':>12}{'artifact':>12}")
+    for label, a, b in rows:
+        print(f"{label:<30}{a:>12,.1f}{b:>12,.1f}")
+    print(f"\nArtifact top-1 matches pipeline.predict on {agree:.2%} of the batch")
+    print(json.dumps(predictor.predict_top_k(batch[:1], k=3)[0]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", type=str, default=None, help="Existing best_model.pkl (default: train one)")
+    parser.add_argument("--classifier", choices=list(make_classifiers()), default="LinearSVC")
+    parser.add_argument("--corpus", type=str, default="synthetic_genres.zip", help="Corpus zip path")
+    parser.add_argument("--batch", type=int, default=20_000, help="Descriptions per scoring batch")
+    parser.add_argument("--out", type=str, default=str(DATA_DIR / "artifact_bench"),
+                        help="Where to write both formats")
+    main(parser.parse_args())
@@ -0,0 +1,84 @@
+# bench_parser.py
+"""Peak memory and parse time of the old read-everything parser against genre_data.
+
+Runs each method in its own process on a synthetic corpus (50x the real
+train_data.txt by default) and reports wall time and peak RSS.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+
+from genre_data import FILE_IN_ZIP, load_genre_frame
+from genre_synth import write_corpus
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, peak_mb  # noqa: E402
+
+REAL_ROWS = 54_214
+METHODS = ["baseline", "legacy", "streaming"]
+
+
+# The parser previously in ml_task_1.py, fed the whole decoded member
+def parse_file(content):
+    lines = [ln.strip() for ln in content.splitlines() if ln.strip()]
+    lines = [ln for ln in lines if not ln.lower().startswith("id :::")]
+    recs = []
+    for ln in lines:
+        parts = [p.strip() for p in ln.split(" ::: ")]
+        if len(parts) >= 4:
+            recs.append({"id": parts[0], "title": parts[1], "genre": parts[2].lower().strip(), "description": " ::: ".join(parts[3:])})
+    return pd.DataFrame(recs)
+
+
+def run_worker(method, path):
+    start = time.perf_counter()
+    if method == "legacy":
+        with zipfile.ZipFile(path, "r") as z:
+            raw = z.read(FILE_IN_ZIP).decode("utf-8", errors="replace")
+        df = parse_file(raw)
+        del raw
+    elif method == "streaming":
+        df = load_genre_frame(path)
+    else:
+        df = pd.DataFrame()
+    seconds = time.perf_counter() - start
+    print(json.dumps({"method": method, "rows": len(df), "seconds": seconds,
+                      "peak_rss_mb": peak_mb(),
+                      "frame_mb": df.memory_usage(deep=True).sum() / 2**20}))
+
+
+def main(scale, path):
+    path = Path(path)
+    if not path.exists():
+        print(f"Generating {path} ({scale}x {REAL_ROWS:,} records)...")
+        write_corpus(path, REAL_ROWS * scale)
+    with zipfile.ZipFile(path) as z:
+        size_mb = z.getinfo(FILE_IN_ZIP).file_size / 2**20
+    print(f"Uncompressed member: {size_mb:.0f} MB")
+
+    print(f"\n{'method':<12}{'rows':>12}{'parse (s)':>11}{'peak RSS (MB)':>15}{'frame (MB)':>12}")
+    for method in METHODS:
+        out = subprocess.run([sys.executable, __file__, "--worker", method, "--file", str(path)],
+                             capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{r['method']:<12}{r['rows']:>12,}{r['seconds']:>11.2f}{fmt_mb(r['peak_rss_mb'], 15)}{r['frame_mb']:>12.0f}")
+    print("\n'baseline' is the interpreter with pandas imported and no data loaded.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=50, help="Corpus size as a multiple of the real dataset")
+    parser.add_argument("--file", type=str, default="synthetic_genres_large.zip", help="Corpus zip path")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.file)
+    else:
+        main(args.scale, args.file)
@@ -0,0 +1,63 @@
+# bench_training.py
+"""Total training wall time: one TF-IDF pipeline per classifier vs vectorize once + parallel fit."""
+import argparse
+import time
+from pathlib import Path
+
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+
+from genre_data import load_genre_frame
+from genre_synth import write_corpus
+from genre_training import fit_classifiers, make_classifiers, make_vectorizer
+
+
+def legacy(X_train, y_train, X_test, y_test, max_features):
+    # What ml_task_1 did before: every pipeline re-tokenizes and rebuilds the vocabulary
+    scores = {}
+    for name, clf in make_classifiers().items():
+        pipe = Pipeline([('tfidf', make_vectorizer(max_features)), ('clf', clf)])
+        pipe.fit(X_train, y_train)
+        scores[name] = accuracy_score(y_test, pipe.predict(X_test))
+    return scores
+
+
+def shared(X_train, y_train, X_test, y_test, max_features, n_jobs):
+    vectorizer = make_vectorizer(max_features)
+    X_train_tfidf = vectorizer.fit_transform(X_train)
+    X_test_tfidf = vectorizer.transform(X_test)
+    fitted = fit_classifiers(X_train_tfidf, y_train, make_classifiers(), n_jobs=n_jobs)
+    return {name: accuracy_score(y_test, clf.predict(X_test_tfidf)) for name, (clf, _) in fitted.items()}
+
+
+def main(path, rows, max_features, n_jobs):
+    path = Path(path)
+    if not path.exists():
+        print(f"Generating {path} ({rows:,} records)...")
+        write_corpus(path, rows)
+    df = load_genre_frame(path)
+    X = df['description'].to_numpy(dtype=object)
+    y = df['genre'].to_numpy(dtype=object)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.18, stratify=y, random_state=42)
+    print(f"{len(X_train):,} training descriptions, {len(set(y)):,} genres")
+
+    timings = {}
+    for label, run in [("separate pipelines", lambda: legacy(X_train, y_train, X_test, y_test, max_features)),
+                       ("shared TF-IDF", lambda: shared(X_train, y_train, X_test, y_test, max_features, n_jobs))]:
+        start = time.perf_counter()
+        scores = run()
+        timings[label] = time.perf_counter() - start
+        accs = ", ".join(f"{name}={acc:.4f}" for name, acc in scores.items())
+        print(f"{label:<20} {timings[label]:>8.1f}s  {accs}")
+    print(f"speedup: {timings['separate pipelines'] / timings['shared TF-IDF']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", type=str, default="synthetic_genres.zip", help="Corpus zip (generated if missing)")
+    parser.add_argument("--rows", type=int, default=54_214, help="Records to generate")
+    parser.add_argument("--max-features", type=int, default=8000, help="TF-IDF vocabulary size")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Worker processes for the shared mode")
+    args = parser.parse_args()
+    main(args.file, args.rows, args.max_features, args.n_jobs)
@@ -0,0 +1,69 @@
+# genre_data.py
+"""Streaming reader for the Genre Classification Dataset inside its zip archive.
+
+Lines are decoded incrementally from the zip member and parsed one at a time,
+so the corpus is never held as one decoded string or as a list of lines.
+Records are grouped into DataFrame chunks with compact dtypes (genre as a
+categorical, text as pandas strings).
+"""
+import io
+import sys
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "common"))
+from chunked_frames import concat_chunks  # noqa: E402
+
+FILE_IN_ZIP = "Genre Classification Dataset/train_data.txt"
+SEPARATOR = " ::: "
+COLUMNS = ["id", "title", "genre", "description"]
+
+
+def parse_line(line):
+    """Return (id, title, genre, description) for a data line, or None for blank/header/short lines."""
+    line = line.strip()
+    if not line or line.lower().startswith("id :::"):
+        return None
+    parts = [p.strip() for p in line.split(SEPARATOR)]
+    if len(parts) < 4:
+        return None
+    return parts[0], parts[1], parts[2].lower().strip(), SEPARATOR.join(parts[3:])
+
+
+def iter_lines(archive, member=FILE_IN_ZIP, encoding="utf-8"):
+    """Yield decoded lines of a zip member without reading it all into memory."""
+    with zipfile.ZipFile(archive, "r") as z, z.open(member) as raw:
+        yield from io.TextIOWrapper(raw, encoding=encoding, errors="replace")
+
+
+def make_chunk(rows):
+    ids, titles, genres, descriptions = zip(*rows)
+    return pd.DataFrame({
+        "id": pd.to_numeric(pd.Series(ids, dtype="string"), errors="coerce").astype("Int64"),
+        "title": pd.Series(titles, dtype="string"),
+        "genre": pd.Series(genres, dtype="category"),
+        "description": pd.Series(descriptions, dtype="string"),
+    })
+
+
+def iter_record_chunks(archive, member=FILE_IN_ZIP, chunk_rows=50_000):
+    """Yield typed DataFrame chunks of at most chunk_rows parsed records."""
+    rows = []
+    for line in iter_lines(archive, member):
+        record = parse_line(line)
+        if record is None:
+            continue
+        rows.append(record)
+        if len(rows) == chunk_rows:
+            yield make_chunk(rows)
+            rows = []
+    if rows:
+        yield make_chunk(rows)
+
+
+def load_genre_frame(archive, member=FILE_IN_ZIP, chunk_rows=50_000):
+    # chunks are merged with their genre categories unioned (see common/chunked_frames.py)
+    empty = pd.DataFrame({col: pd.Series(dtype="string") for col in COLUMNS})
+    return concat_chunks(iter_record_chunks(archive, member, chunk_rows), empty=empty)
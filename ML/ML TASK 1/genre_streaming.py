@@ -0,0 +1,118 @@
+# genre_streaming.py
+"""Out-of-core training over the full genre corpus.
+
+Records are streamed from the zip in mini-batches (genre_data), turned into
+features by a stateless HashingVectorizer and fed to classifiers that support
+partial_fit. Nothing grows with the corpus: the vectorizer has no vocabulary,
+each batch is dropped after use, and the held-out rows used for evaluation
+are capped at `max_eval_rows`.
+
+Rows are assigned to the held-out set by a hash of their id, so the split is
+the same in every epoch and every run without storing it.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+from genre_data import FILE_IN_ZIP, iter_record_chunks
+
+
+def make_hashing_vectorizer(n_features=2**18):
+    # alternate_sign=False keeps the features non-negative for MultinomialNB
+    return HashingVectorizer(n_features=n_features, ngram_range=(1, 2), stop_words='english',
+                             alternate_sign=False, norm='l2')
+
+
+def make_incremental_classifiers(random_state=42):
+    """Fresh classifiers that support partial_fit."""
+    return {
+        "SGD (hinge)": SGDClassifier(loss='hinge', alpha=1e-6, random_state=random_state),
+        "SGD (log loss)": SGDClassifier(loss='log_loss', alpha=1e-6, random_state=random_state),
+        "MultinomialNB": MultinomialNB(alpha=0.01),
+    }
+
+
+def clean_descriptions(chunk):
+    return chunk['description'].astype(str).str.replace(r'\s+', ' ', regex=True).str.strip().to_numpy(dtype=object)
+
+
+def held_out_mask(ids, test_size):
+    """Deterministic per-row split: True for rows in the held-out set."""
+    return pd.util.hash_array(ids.fillna(-1).to_numpy(dtype=np.int64)) % np.uint64(10_000) < np.uint64(test_size * 10_000)
+
+
+def scan_classes(archive, member=FILE_IN_ZIP, chunk_rows=50_000):
+    """One streaming pass to collect the genre labels partial_fit needs up front."""
+    classes = set()
+    for chunk in iter_record_chunks(archive, member, chunk_rows):
+        classes.update(chunk['genre'].dropna().unique())
+    return np.array(sorted(classes), dtype=object)
+
+
+def train_out_of_core(archive, member=FILE_IN_ZIP, classifiers=None, vectorizer=None, n_epochs=3,
+                      chunk_rows=20_000, test_size=0.1, max_eval_rows=50_000, random_state=42):
+    """Train every classifier on the whole corpus, one mini-batch at a time.
+
+    Returns (fitted classifiers, vectorizer, history) where history has one
+    row per (epoch, classifier) with accuracy, macro_f1, rows and rows/sec.
+    """
+    classifiers = classifiers or make_incremental_classifiers(random_state)
+    vectorizer = vectorizer or make_hashing_vectorizer()
+    classes = scan_classes(archive, member)
+    print(f"Found {len(classes)} genres")
+
+    rng = np.random.default_rng(random_state)
+    eval_X, eval_y, eval_rows = [], [], 0
+    history = []
+    for epoch in range(1, n_epochs + 1):
+        train_seconds = {name: 0.0 for name in classifiers}
+        rows = 0
+        epoch_start = time.perf_counter()
+        for chunk in iter_record_chunks(archive, member, chunk_rows):
+            chunk = chunk.dropna(subset=['description', 'genre'])
+            test = held_out_mask(chunk['id'], test_size)
+            X = vectorizer.transform(clean_descriptions(chunk))
+            y = chunk['genre'].to_numpy(dtype=object)
+
+            if epoch == 1 and eval_rows < max_eval_rows and test.any():
+                keep = np.flatnonzero(test)[:max_eval_rows - eval_rows]
+                eval_X.append(X[keep])
+                eval_y.append(y[keep])
+                eval_rows += len(keep)
+
+            order = rng.permutation(np.flatnonzero(~test))
+            X_train, y_train = X[order], y[order]
+            rows += len(order)
+            for name, clf in classifiers.items():
+                start = time.perf_counter()
+                clf.partial_fit(X_train, y_train, classes=classes)
+                train_seconds[name] += time.perf_counter() - start
+
+        elapsed = time.perf_counter() - epoch_start
+        X_eval = sp.vstack(eval_X, format='csr') if eval_X else None
+        y_eval = np.concatenate(eval_y) if eval_y else np.array([], dtype=object)
+        for name, clf in classifiers.items():
+            preds = clf.predict(X_eval) if len(y_eval) else np.array([])
+            record = {
+                'epoch': epoch, 'model': name, 'rows': rows,
+                'accuracy': accuracy_score(y_eval, preds) if len(y_eval) else float('nan'),
+                'macro_f1': f1_score(y_eval, preds, average='macro', zero_division=0) if len(y_eval) else float('nan'),
+                'fit_rows_per_sec': rows / train_seconds[name] if train_seconds[name] else float('nan'),
+                'epoch_rows_per_sec': rows / elapsed,
+            }
+            history.append(record)
+            print(f"epoch {epoch} {name}: acc={record['accuracy']:.4f} macro_f1={record['macro_f1']:.4f} "
+                  f"fit={record['fit_rows_per_sec']:,.0f} rows/s (epoch incl. parsing {record['epoch_rows_per_sec']:,.0f} rows/s)")
+    return classifiers, vectorizer, pd.DataFrame(history)
+
+
+def make_streaming_pipeline(vectorizer, clf):
+    """The hashing vectorizer is stateless, so vectorizer + fitted classifier is a complete pipeline."""
+    return Pipeline([('hashing', vectorizer), ('clf', clf)])
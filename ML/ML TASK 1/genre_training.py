@@ -0,0 +1,65 @@
+# genre_training.py
+"""Vectorize once, train every genre classifier in parallel on the shared TF-IDF matrix.
+
+The TF-IDF matrix is dumped to a temporary folder and memory-mapped back
+(its data/indices/indptr arrays), so the joblib workers read the same pages
+instead of each receiving a pickled copy. Each fitted classifier is then
+paired with the one fitted vectorizer in a regular sklearn Pipeline, so the
+saved artifact still predicts straight from raw descriptions.
+"""
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.multiclass import OneVsRestClassifier
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+
+
+def make_vectorizer(max_features=8000):
+    return TfidfVectorizer(max_features=max_features, ngram_range=(1, 2), stop_words='english')
+
+
+def make_classifiers():
+    """Fresh, unfitted classifiers; add entries here to compare more models."""
+    return {
+        # liblinear is one-vs-rest for multiclass; newer sklearn requires spelling that out
+        "LogisticRegression": OneVsRestClassifier(LogisticRegression(max_iter=1500, solver='liblinear')),
+        "MultinomialNB": MultinomialNB(),
+        "LinearSVC": LinearSVC(max_iter=20000),
+    }
+
+
+def fit_one(name, clf, X, y):
+    start = time.perf_counter()
+    clf.fit(X, y)
+    return name, clf, time.perf_counter() - start
+
+
+def fit_classifiers(X, y, classifiers, n_jobs=-1):
+    """Fit all classifiers concurrently on one memory-mapped copy of X.
+
+    Returns {name: (fitted classifier, fit seconds)}.
+    """
+    folder = tempfile.mkdtemp(prefix="genre_tfidf_")
+    try:
+        path = Path(folder) / "X.joblib"
+        joblib.dump(X, path)
+        # copy-on-write: liblinear wants writable arrays, pages stay shared until written
+        X_shared = joblib.load(path, mmap_mode='c')
+        fitted = Parallel(n_jobs=n_jobs)(delayed(fit_one)(name, clf, X_shared, y)
+                                         for name, clf in classifiers.items())
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return {name: (clf, seconds) for name, clf, seconds in fitted}
+
+
+def make_pipeline(vectorizer, clf):
+    """Wrap an already fitted vectorizer and classifier as one predict pipeline."""
+    return Pipeline([('tfidf', vectorizer), ('clf', clf)])
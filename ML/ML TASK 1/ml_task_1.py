@@ -1,43 +1,35 @@
 # train_movie_genre.py
-import zipfile, pickle, shutil, os
+import pickle, shutil
 from pathlib import Path
-import re
-import textwrap
-import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.pipeline import Pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.svm import LinearSVC
-from sklearn.metrics import accuracy_score, classification_report, f1_score
+import time
 import argparse
+# pandas, sklearn and the genre_* helpers are imported by the mode that runs,
+# so --help and argument errors return without loading them
 
 # CONFIG
 ARCHIVE = ARCHIVE = r"C:\Users\sudsm\Desktop\CodeSoft\CodeSoft Code\ML\archive.zip"
-FILE_IN_ZIP = "Genre Classification Dataset/train_data.txt"
 OUTPUT_DIR = Path("movie_genre_classifier_out")
 TOP_N = 12            # set None to keep all
 SAMPLES_PER_CLASS = 400   # set None to use all (lower to speed up)
 TEST_SIZE = 0.18
 RANDOM_STATE = 42
 TFIDF_MAX_FEATURES = 8000
+N_JOBS = -1               # worker processes for classifier training
+# --out-of-core mode: uses every record and genre, ignores TOP_N/SAMPLES_PER_CLASS
+EPOCHS = 3
+CHUNK_ROWS = 20_000       # records per mini-batch
+HOLDOUT = 0.1             # share of ids held out for evaluation
+MAX_EVAL_ROWS = 50_000    # cap on held-out rows kept in memory
 
-def parse_file(content):
-    lines = [ln.strip() for ln in content.splitlines() if ln.strip()]
-    lines = [ln for ln in lines if not ln.lower().startswith("id :::")]
-    recs = []
-    for ln in lines:
-        parts = [p.strip() for p in ln.split(" ::: ")]
-        if len(parts) >= 4:
-            recs.append({"id": parts[0], "title": parts[1], "genre": parts[2].lower().strip(), "description": " ::: ".join(parts[3:])})
-    return pd.DataFrame(recs)
-
-def main():
-    assert Path(ARCHIVE).exists(), f"{ARCHIVE} not found."
-    with zipfile.ZipFile(ARCHIVE, 'r') as z:
-        raw = z.read(FILE_IN_ZIP).decode('utf-8', errors='replace')
-    df = parse_file(raw)
+def train_sampled():
+    """Original mode: load, subsample, TF-IDF and fit in memory. Returns (results, README lines)."""
+    from sklearn.model_selection import train_test_split
+    from sklearn.metrics import accuracy_score, classification_report, f1_score
+    from genre_data import FILE_IN_ZIP, load_genre_frame
+    from genre_training import fit_classifiers, make_classifiers, make_pipeline, make_vectorizer
+
+    # Stream records straight from the zip member (see genre_data.py)
+    df = load_genre_frame(ARCHIVE, FILE_IN_ZIP)
     df = df.dropna(subset=['description', 'genre']).copy()
     df['description'] = df['description'].astype(str).str.replace(r'\s+', ' ', regex=True).str.strip()
 
@@ -47,28 +39,58 @@ def main():
         print("Keeping top genres:", top)
 
     if SAMPLES_PER_CLASS:
-        df = df.groupby('genre').apply(lambda g: g.sample(n=min(len(g), SAMPLES_PER_CLASS), random_state=RANDOM_STATE)).reset_index(drop=True)
+        df = df.sample(frac=1, random_state=RANDOM_STATE).groupby('genre', observed=True).head(SAMPLES_PER_CLASS).reset_index(drop=True)
 
-    X = df['description'].values
-    y = df['genre'].values
+    df['genre'] = df['genre'].cat.remove_unused_categories()
+    X = df['description'].to_numpy(dtype=object)
+    y = df['genre'].to_numpy(dtype=object)
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=TEST_SIZE, stratify=y, random_state=RANDOM_STATE)
 
-    pipelines = {
-        "LogisticRegression": Pipeline([('tfidf', TfidfVectorizer(max_features=TFIDF_MAX_FEATURES, ngram_range=(1,2), stop_words='english')), ('clf', LogisticRegression(max_iter=1500, solver='liblinear'))]),
-        "MultinomialNB": Pipeline([('tfidf', TfidfVectorizer(max_features=TFIDF_MAX_FEATURES, ngram_range=(1,2), stop_words='english')), ('clf', MultinomialNB())]),
-        "LinearSVC": Pipeline([('tfidf', TfidfVectorizer(max_features=TFIDF_MAX_FEATURES, ngram_range=(1,2), stop_words='english')), ('clf', LinearSVC(max_iter=20000))])
-    }
+    # Tokenize and build the vocabulary once, then train every classifier
+    # concurrently on the shared sparse matrix (see genre_training.py)
+    start = time.perf_counter()
+    vectorizer = make_vectorizer(TFIDF_MAX_FEATURES)
+    X_train_tfidf = vectorizer.fit_transform(X_train)
+    X_test_tfidf = vectorizer.transform(X_test)
+    vectorize_time = time.perf_counter() - start
+    fitted = fit_classifiers(X_train_tfidf, y_train, make_classifiers(), n_jobs=N_JOBS)
+    print(f"Vectorized in {vectorize_time:.1f}s, trained {len(fitted)} classifiers in "
+          f"{time.perf_counter() - start - vectorize_time:.1f}s (total {time.perf_counter() - start:.1f}s)")
 
     results = {}
-    for name, pipe in pipelines.items():
-        print("Training", name)
-        pipe.fit(X_train, y_train)
-        preds = pipe.predict(X_test)
+    for name, (clf, fit_seconds) in fitted.items():
+        preds = clf.predict(X_test_tfidf)
         acc = accuracy_score(y_test, preds)
         macro_f1 = f1_score(y_test, preds, average='macro')
-        print(f"{name} acc={acc:.4f} macro_f1={macro_f1:.4f}")
+        print(f"{name} acc={acc:.4f} macro_f1={macro_f1:.4f} fit={fit_seconds:.1f}s")
         print(classification_report(y_test, preds, zero_division=0))
-        results[name] = (pipe, acc, macro_f1)
+        results[name] = (make_pipeline(vectorizer, clf), acc, macro_f1)
+
+    return results, [f"TF-IDF max features: {TFIDF_MAX_FEATURES}",
+                     f"Top genres kept: {TOP_N}",
+                     f"Samples per class: {SAMPLES_PER_CLASS}"]
+
+def train_streaming():
+    """Out-of-core mode: hashed features and partial_fit over the full corpus (see genre_streaming.py)."""
+    from genre_data import FILE_IN_ZIP
+    from genre_streaming import make_streaming_pipeline, train_out_of_core
+
+    classifiers, vectorizer, history = train_out_of_core(
+        ARCHIVE, FILE_IN_ZIP, n_epochs=EPOCHS, chunk_rows=CHUNK_ROWS, test_size=HOLDOUT,
+        max_eval_rows=MAX_EVAL_ROWS, random_state=RANDOM_STATE)
+    final = history[history['epoch'] == history['epoch'].max()].set_index('model')
+    print(final[['accuracy', 'macro_f1', 'fit_rows_per_sec']].round(4).to_string())
+    results = {name: (make_streaming_pipeline(vectorizer, clf), final.loc[name, 'accuracy'], final.loc[name, 'macro_f1'])
+               for name, clf in classifiers.items()}
+    return results, [f"Out-of-core: hashed 1-2 grams ({vectorizer.n_features} features), {EPOCHS} epochs",
+                     f"Training rows per epoch: {int(final['rows'].iloc[0])}",
+                     f"Held-out share: {HOLDOUT} (capped at {MAX_EVAL_ROWS} rows)"]
+
+def main(args):
+    from genre_artifact import export_artifact
+
+    assert Path(ARCHIVE).exists(), f"{ARCHIVE} not found."
+    results, notes = train_streaming() if args.out_of_core else train_sampled()
 
     best_name = max(results.keys(), key=lambda k: results[k][1])
     best_pipe = results[best_name][0]
@@ -77,13 +99,11 @@ def main():
     OUTPUT_DIR.mkdir(exist_ok=True)
     with open(OUTPUT_DIR / "best_model.pkl", "wb") as f:
         pickle.dump({"pipeline": best_pipe}, f)
+    # Compact, memory-mapped copy for fast loading and batch top-k scoring (see genre_artifact.py)
+    export_artifact(best_pipe, OUTPUT_DIR / "artifact", name=best_name)
 
-    (OUTPUT_DIR / "README.txt").write_text(textwrap.dedent(f"""
-    Best model: {best_name}
-    TF-IDF max features: {TFIDF_MAX_FEATURES}
-    Top genres kept: {TOP_N}
-    Samples per class: {SAMPLES_PER_CLASS}
-    """).strip())
+    notes.append("artifact/: load with genre_artifact.GenrePredictor.load(path), then predict_top_k(descriptions, k)")
+    (OUTPUT_DIR / "README.txt").write_text("\n".join([f"Best model: {best_name}"] + notes))
 
     # zip it
     zipname = OUTPUT_DIR.parent / (OUTPUT_DIR.name + ".zip")
@@ -92,4 +112,7 @@ def main():
     print("Saved outputs to:", OUTPUT_DIR, "zipped at:", zipname)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out-of-core", action="store_true",
+                        help="Stream the full corpus with hashed features and partial_fit classifiers")
+    main(parser.parse_args())
@@ -0,0 +1,84 @@
+# bench_encoding.py
+"""Time and memory of the original preprocessing loop against FraudEncoder.
+
+Both methods start from the same typed frame (fraud_data.load_fraud on the
+synthetic CSVs from fraud_synth.py) and run in their own process. Memory is
+the growth of peak RSS during encoding, on top of the peak after loading.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from fraud_data import load_fraud
+from fraud_features import FraudEncoder
+from fraud_synth import DATA_DIR, ensure_fraud_dataset
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, mb_diff, peak_mb, timed  # noqa: E402
+
+METHODS = ["legacy", "encoder"]
+
+
+# The preprocessing previously in ml_task_2.py: encode and scale everything, then split
+def legacy_preprocess(df):
+    y = df["is_fraud"]
+    X = df.drop(columns=["is_fraud"])
+    cat_cols = X.select_dtypes(include=["object", "category"]).columns
+    le = LabelEncoder()
+    for col in cat_cols:
+        if X[col].nunique() > 20:
+            X[col] = le.fit_transform(X[col])
+        else:
+            dummies = pd.get_dummies(X[col], prefix=col, drop_first=True)
+            X = pd.concat([X.drop(columns=[col]), dummies], axis=1)
+    X_scaled = StandardScaler().fit_transform(X)
+    return train_test_split(X_scaled, y, test_size=0.2, random_state=42, stratify=y)
+
+
+def encoder_preprocess(df):
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42, stratify=df["is_fraud"])
+    encoder = FraudEncoder()
+    return encoder.fit_transform(train_df), encoder.transform(test_df), train_df["is_fraud"], test_df["is_fraud"]
+
+
+def run_worker(method, paths):
+    df = load_fraud(paths, cache_path=None)
+    loaded = peak_mb()
+    (X_train, X_test, _, _), seconds = timed(legacy_preprocess if method == "legacy" else encoder_preprocess, df)
+    nbytes = sum(X.data.nbytes + X.indices.nbytes + X.indptr.nbytes if hasattr(X, "indptr") else X.nbytes
+                 for X in (X_train, X_test))
+    print(json.dumps({"method": method, "seconds": seconds, "extra_peak_mb": mb_diff(peak_mb(), loaded),
+                      "matrix_mb": nbytes / 2**20, "shape": list(X_train.shape)}))
+
+
+def main(args):
+    folder = Path(args.dir)
+    ensure_fraud_dataset(folder)
+
+    print(f"\n{'method':<10}{'encode (s)':>12}{'extra peak (MB)':>17}{'matrices (MB)':>15}  train shape")
+    for method in METHODS:
+        out = subprocess.run([sys.executable, __file__, "--worker", method, "--dir", str(folder)],
+                             capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{r['method']:<10}{r['seconds']:>12.2f}{fmt_mb(r['extra_peak_mb'], 17)}{r['matrix_mb']:>15.0f}  {tuple(r['shape'])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", type=str, default=str(DATA_DIR / "fraud_kaggle"),
+                        help="Folder with fraudTrain.csv / fraudTest.csv")
+    parser.add_argument("--worker", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        folder = Path(args.dir)
+        run_worker(args.worker, [folder / "fraudTrain.csv", folder / "fraudTest.csv"])
+    else:
+        main(args)
@@ -0,0 +1,76 @@
+# bench_loading.py
+"""Peak memory and load time of the original fraud loader against fraud_data.
+
+Generates synthetic train/test CSVs the size of the Kaggle files (~1.85M rows
+together) unless they already exist, then loads them with each method in its
+own process and reports wall time, peak RSS and the size of the final frame.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from fraud_data import load_fraud
+from fraud_synth import DATA_DIR, KAGGLE_ROWS, ensure_fraud_dataset
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, peak_mb  # noqa: E402
+
+METHODS = ["baseline", "legacy", "typed", "chunked", "parquet"]
+
+
+def run_worker(method, train, test, cache):
+    start = time.perf_counter()
+    if method == "legacy":
+        df = pd.concat([pd.read_csv(train), pd.read_csv(test)], ignore_index=True)
+    elif method == "typed":
+        df = load_fraud([train, test], chunksize=None)
+    elif method == "chunked":
+        df = load_fraud([train, test])
+    elif method in ("parquet", "write-cache"):
+        df = load_fraud([train, test], cache_path=cache)
+    else:
+        df = pd.DataFrame()
+    seconds = time.perf_counter() - start
+    print(json.dumps({"method": method, "rows": len(df), "seconds": seconds,
+                      "peak_rss_mb": peak_mb(),
+                      "frame_mb": df.memory_usage(deep=True).sum() / 2**20}))
+
+
+def main(args):
+    folder = Path(args.dir)
+    ensure_fraud_dataset(folder, KAGGLE_ROWS * args.scale)
+    cache = folder / "fraud.parquet"
+    if cache.exists():
+        cache.unlink()
+    # in a child process: ru_maxrss is inherited by the workers forked from this one
+    subprocess.run([sys.executable, __file__, "--worker", "write-cache", "--dir", str(folder)],
+                   capture_output=True, check=True)
+
+    print(f"\n{'method':<12}{'rows':>12}{'load (s)':>10}{'peak RSS (MB)':>15}{'frame (MB)':>12}")
+    for method in METHODS:
+        out = subprocess.run([sys.executable, __file__, "--worker", method, "--dir", str(folder)],
+                             capture_output=True, text=True, check=True)
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{r['method']:<12}{r['rows']:>12,}{r['seconds']:>10.2f}{fmt_mb(r['peak_rss_mb'], 15)}{r['frame_mb']:>12.0f}")
+    print("\n'baseline' is the interpreter with pandas imported and no data loaded; "
+          "'parquet' reads the cache written by a previous load.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", type=str, default=str(DATA_DIR / "fraud_kaggle"),
+                        help="Folder with fraudTrain.csv / fraudTest.csv")
+    parser.add_argument("--scale", type=int, default=1, help="Generated size as a multiple of the real files")
+    parser.add_argument("--worker", choices=METHODS + ["write-cache"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        folder = Path(args.dir)
+        run_worker(args.worker, folder / "fraudTrain.csv", folder / "fraudTest.csv", folder / "fraud.parquet")
+    else:
+        main(args)
@@ -0,0 +1,134 @@
+# bench_stages.py
+"""Stage-level benchmark of ml_task_2 on synthetic data of growing size.
+
+For every size a synthetic train/test pair is generated once (fraud_synth.py)
+and each stage of the script is measured in its own process:
+
+    load                 load_data from the CSVs (no Parquet cache)
+    preprocess           preprocess_data
+    model:<name>         fitting and evaluating one model from make_models
+
+A stage's process runs the stages before it untimed, then records wall time,
+peak RSS and how much the stage raised the peak. Results are written to a JSON
+report; if a previous report exists (--report, or --baseline) every stage is
+compared to it and slowdowns or memory growth beyond --tolerance are flagged,
+with exit status 1 so the script can serve as a check.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fraud_synth import DATA_DIR, ensure_fraud_dataset
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, mb_diff, peak_mb  # noqa: E402
+
+SIZES = [100_000, 1_000_000]
+
+
+def run_worker(stage, train, test):
+    import ml_task_2
+    # ml_task_2 imports these lazily; load them up front so no stage is charged for it
+    import fraud_data, fraud_features, fraud_training, sklearn.model_selection  # noqa: F401
+
+    # the script prints its progress and reports; keep stdout for the JSON line
+    with contextlib.redirect_stdout(io.StringIO()):
+        before, start, extra = peak_mb(), time.perf_counter(), {}
+        df = ml_task_2.load_data(train, test, cache_path=None)
+        if stage != "load":
+            before, start = peak_mb(), time.perf_counter()
+            X_train, X_test, y_train, y_test = ml_task_2.preprocess_data(df)
+            if stage.startswith("model:"):
+                name = stage.split(":", 1)[1]
+                model = ml_task_2.make_models()[name]
+                before, start = peak_mb(), time.perf_counter()
+                extra = ml_task_2.evaluate_model(name, model, X_train, X_test, y_train, y_test)
+        seconds = time.perf_counter() - start
+    print(json.dumps({"stage": stage, "seconds": seconds, "peak_rss_mb": peak_mb(),
+                      "stage_peak_mb": mb_diff(peak_mb(), before), **extra}))
+
+
+def run_stage(stage, train, test):
+    out = subprocess.run([sys.executable, __file__, "--worker", stage, "--train", str(train), "--test", str(test)],
+                         capture_output=True, text=True, check=True, cwd=Path(__file__).parent)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Print each stage next to the baseline run; returns the number of flagged stages."""
+    previous = {(r["rows"], r["stage"]): r for r in baseline["results"]}
+    flagged = 0
+    print(f"\nCompared with the run of {baseline['created']}:")
+    print(f"{'rows':>12}  {'stage':<26}{'time x':>8}{'peak x':>8}")
+    for r in results:
+        old = previous.get((r["rows"], r["stage"]))
+        if old is None:
+            continue
+        time_ratio = r["seconds"] / old["seconds"] if old["seconds"] else float("nan")
+        peak_ratio = r["peak_rss_mb"] / old["peak_rss_mb"] if old["peak_rss_mb"] and r["peak_rss_mb"] else float("nan")
+        worse = time_ratio > 1 + tolerance or peak_ratio > 1 + tolerance
+        flagged += worse
+        print(f"{r['rows']:>12,}  {r['stage']:<26}{time_ratio:>8.2f}{peak_ratio:>8.2f}{'  REGRESSION' if worse else ''}")
+    return flagged
+
+
+def main(args):
+    import ml_task_2
+
+    stages = ["load", "preprocess"] + [f"model:{name}" for name in (args.models or ml_task_2.make_models())]
+    report_path = Path(args.report)
+    baseline_path = Path(args.baseline) if args.baseline else report_path
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+
+    results = []
+    print(f"{'rows':>12}  {'stage':<26}{'time (s)':>10}{'peak RSS (MB)':>15}{'stage peak (MB)':>17}")
+    for rows in args.sizes:
+        train, test = ensure_fraud_dataset(Path(args.dir) / str(rows), rows, seed=args.seed)
+        for stage in stages:
+            r = {"rows": rows, **run_stage(stage, train, test)}
+            results.append(r)
+            print(f"{rows:>12,}  {stage:<26}{r['seconds']:>10.2f}{fmt_mb(r['peak_rss_mb'], 15)}{fmt_mb(r['stage_peak_mb'], 17)}")
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "results": results,
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+    print(f"\nReport written to {report_path}")
+    if baseline is not None and compare(results, baseline, args.tolerance):
+        print(f"Some stages are more than {args.tolerance:.0%} slower or larger than the baseline.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Total rows per synthetic dataset (100k-50M)")
+    parser.add_argument("--models", nargs="+", default=None, help="Models from make_models to time (default: all)")
+    parser.add_argument("--dir", type=str, default=str(DATA_DIR / "fraud_stages"),
+                        help="Where generated datasets are kept")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--report", type=str, default=str(DATA_DIR.parent / "bench_stages.json"),
+                        help="JSON report to write")
+    parser.add_argument("--baseline", type=str, default=None, help="Report to compare with (default: the previous --report)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown / memory growth")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--train", help=argparse.SUPPRESS)
+    parser.add_argument("--test", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.train, args.test)
+    else:
+        main(args)
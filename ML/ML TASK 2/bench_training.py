@@ -0,0 +1,51 @@
+# bench_training.py
+"""Current training mode against the fast downsampled mode (fraud_training.py).
+
+Both modes train the same three models on the same encoded split of a
+synthetic dataset; the table shows fit time, F1 at the default threshold and
+AUPRC for each, plus the speedup and the metric differences (fast - current).
+"""
+import argparse
+import contextlib
+import io
+
+from fraud_synth import DATA_DIR, KAGGLE_ROWS, ensure_fraud_dataset
+from ml_task_2 import evaluate_model, load_data, make_fast_models, make_models, preprocess_data
+
+
+def run_mode(models, X_train, X_test, y_train, y_test):
+    results = {}
+    for name, model in models.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = evaluate_model(name, model, X_train, X_test, y_train, y_test)
+    return results
+
+
+def main(args):
+    train, test = ensure_fraud_dataset(f"{args.dir}_{args.rows}", args.rows)
+    with contextlib.redirect_stdout(io.StringIO()):
+        X_train, X_test, y_train, y_test = preprocess_data(load_data(train, test, cache_path=None))
+    print(f"Training rows: {X_train.shape[0]:,} ({int(y_train.sum()):,} frauds)")
+
+    current = run_mode(make_models(), X_train, X_test, y_train, y_test)
+    fast = run_mode(make_fast_models(args.negative_rate, args.correction), X_train, X_test, y_train, y_test)
+
+    print(f"\n{'model':<20}{'fit (s)':>9}{'fast (s)':>10}{'speedup':>9}{'F1':>8}{'fast F1':>9}{'dF1':>8}"
+          f"{'AUPRC':>8}{'fast':>8}{'dAUPRC':>8}")
+    for name in current:
+        c, f = current[name], fast[name]
+        print(f"{name:<20}{c['fit_seconds']:>9.1f}{f['fit_seconds']:>10.1f}{c['fit_seconds'] / f['fit_seconds']:>8.1f}x"
+              f"{c['f1']:>8.4f}{f['f1']:>9.4f}{f['f1'] - c['f1']:>+8.4f}"
+              f"{c['auprc']:>8.4f}{f['auprc']:>8.4f}{f['auprc'] - c['auprc']:>+8.4f}")
+    print(f"\nfast = all frauds + {args.negative_rate:.0%} of legitimate rows, {args.correction} correction, "
+          "RandomForest n_jobs=-1")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=KAGGLE_ROWS, help="Synthetic transactions (train + test)")
+    parser.add_argument("--dir", type=str, default=str(DATA_DIR / "fraud"),
+                        help="Prefix of the generated dataset folder")
+    parser.add_argument("--negative-rate", type=float, default=0.1)
+    parser.add_argument("--correction", choices=["weight", "probability"], default="weight")
+    main(parser.parse_args())
@@ -0,0 +1,127 @@
+# fraud_data.py
+"""Typed, chunked loading of the credit card fraud train/test CSVs.
+
+Only the columns the model uses are parsed, with an explicit schema: the
+repeated text columns (merchant, category, state, job, names, ...) become
+categoricals and amounts/coordinates float32, instead of object strings and
+64-bit numbers. Files are read chunk by chunk and each chunk is split into
+its columns and dropped (see chunked_frames.concat_chunks): categoricals keep
+only their codes against one merged category list. The peak is about the
+finished frame plus one chunk and one column being joined, not the chunks
+held next to their concatenation.
+
+With a cache path the typed frame is also written to Parquet (needs pyarrow),
+with the path, size and mtime of every source CSV in its metadata, and read
+back from there while those still match.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "common"))
+from chunked_frames import concat_chunks  # noqa: E402
+
+# Everything preprocess_data uses; the row index, trans_date_trans_time and trans_num are never read
+USECOLS = ['cc_num', 'merchant', 'category', 'amt', 'first', 'last', 'gender', 'street', 'city',
+           'state', 'zip', 'lat', 'long', 'city_pop', 'job', 'dob', 'unix_time', 'merch_lat',
+           'merch_long', 'is_fraud']
+DTYPES = {
+    'trans_date_trans_time': 'string',
+    'trans_num': 'string',
+    'cc_num': 'int64',
+    'merchant': 'category',
+    'category': 'category',
+    'amt': 'float32',
+    'first': 'category',
+    'last': 'category',
+    'gender': 'category',
+    'street': 'category',
+    'city': 'category',
+    'state': 'category',
+    'zip': 'int32',
+    'lat': 'float32',
+    'long': 'float32',
+    'city_pop': 'int32',
+    'job': 'category',
+    'dob': 'category',
+    'unix_time': 'int64',
+    'merch_lat': 'float32',
+    'merch_long': 'float32',
+    'is_fraud': 'int8',
+}
+CHUNKSIZE = 200_000
+SOURCES_KEY = b"fraud_data.sources"
+
+
+def read_csv_typed(path, usecols=USECOLS, chunksize=None):
+    dtype = {col: DTYPES[col] for col in usecols if col in DTYPES}
+    return pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize)
+
+
+def iter_fraud_chunks(paths, chunksize=CHUNKSIZE, usecols=USECOLS):
+    """Stream one or more fraud CSVs as typed DataFrame chunks of at most chunksize rows."""
+    for path in [paths] if isinstance(paths, (str, os.PathLike)) else paths:
+        with read_csv_typed(path, usecols, chunksize) as reader:
+            yield from reader
+
+
+def source_stamps(paths):
+    """[resolved path, size, mtime in ns] of every CSV, in order, as stored with the cache."""
+    stamps = []
+    for path in paths:
+        path = Path(path).resolve()
+        stat = path.stat()
+        stamps.append([str(path), stat.st_size, stat.st_mtime_ns])
+    return stamps
+
+
+def cache_is_fresh(cache_path, paths, usecols):
+    cache_path = Path(cache_path)
+    if not cache_path.exists():
+        return False
+    import pyarrow.parquet as pq
+    schema = pq.read_schema(cache_path)
+    stored = (schema.metadata or {}).get(SOURCES_KEY)
+    if stored is None or json.loads(stored) != source_stamps(paths):
+        return False
+    return set(usecols) <= set(schema.names)
+
+
+def write_cache(df, cache_path, paths):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), SOURCES_KEY: json.dumps(source_stamps(paths)).encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), cache_path)
+
+
+def load_fraud(paths, usecols=USECOLS, chunksize=CHUNKSIZE, cache_path=None):
+    """Load and concatenate the fraud CSVs with explicit dtypes.
+
+    chunksize=None parses each file in one go (faster, higher peak memory).
+    cache_path, if given, is a Parquet file reused while it was written from
+    these same CSVs (path, size and mtime); it is skipped with a note when
+    pyarrow is not installed.
+    """
+    paths = [paths] if isinstance(paths, (str, os.PathLike)) else list(paths)
+    if cache_path is not None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("pyarrow is not installed, not using the Parquet cache")
+            cache_path = None
+    if cache_path is not None and cache_is_fresh(cache_path, paths, usecols):
+        print(f"Loaded cached dataset from {cache_path}")
+        return pd.read_parquet(cache_path, columns=list(usecols))
+
+    if chunksize:
+        df = concat_chunks(iter_fraud_chunks(paths, chunksize, usecols))
+    else:
+        df = concat_chunks(read_csv_typed(path, usecols) for path in paths)
+    if cache_path is not None:
+        write_cache(df, cache_path, paths)
+        print(f"Cached dataset to {cache_path}")
+    return df
@@ -0,0 +1,99 @@
+# fraud_features.py
+"""Sparse design matrix for the fraud data, fitted on the training rows only.
+
+FraudEncoder turns a frame from fraud_data.load_fraud into one SciPy CSR
+matrix:
+
+    [numeric columns | ordinal codes of high-cardinality columns | one-hot of low-cardinality columns]
+
+Like the original preprocessing, text columns with more than `onehot_max`
+distinct values get an integer code and the others are one-hot encoded. The
+numeric and ordinal columns are standardized with the training mean and
+standard deviation; the one-hot columns stay 0/1 so the matrix stays sparse.
+
+Categories not seen during fit get code -1 (before scaling) and an all-zero
+one-hot block. Every row has the same layout, so the CSR arrays are built
+directly in one pass instead of concatenating frames per column.
+"""
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+TARGET = 'is_fraud'
+
+
+class FraudEncoder:
+    """Fit on the training frame, then transform any frame to a CSR matrix."""
+
+    def __init__(self, onehot_max=20, scale=True, dtype=np.float32, exclude=(TARGET,)):
+        self.onehot_max = onehot_max
+        self.scale = scale
+        self.dtype = dtype
+        self.exclude = list(exclude)
+
+    def fit(self, df):
+        columns = [c for c in df.columns if c not in self.exclude]
+        text = [c for c in columns if isinstance(df[c].dtype, pd.CategoricalDtype)
+                or pd.api.types.is_object_dtype(df[c]) or pd.api.types.is_string_dtype(df[c])]
+        self.numeric_columns_ = [c for c in columns if c not in text]
+        self.categories_ = {}
+        for col in text:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # only the categories that occur in these rows
+                codes = values.cat.codes.to_numpy()
+                present = values.cat.categories[np.unique(codes[codes >= 0])].to_numpy(dtype=object)
+            else:
+                present = values.dropna().unique().astype(object)
+            self.categories_[col] = pd.Index(np.sort(present))
+        self.ordinal_columns_ = [c for c in text if len(self.categories_[c]) > self.onehot_max]
+        self.onehot_columns_ = [c for c in text if len(self.categories_[c]) <= self.onehot_max]
+        offsets = np.cumsum([0] + [len(self.categories_[c]) for c in self.onehot_columns_])
+        self.onehot_offsets_ = offsets[:-1] + len(self.numeric_columns_) + len(self.ordinal_columns_)
+        self.n_features_ = int(offsets[-1]) + len(self.numeric_columns_) + len(self.ordinal_columns_)
+
+        dense = self._dense_block(df)
+        self.mean_ = dense.mean(axis=0) if self.scale else np.zeros(dense.shape[1])
+        std = dense.std(axis=0) if self.scale else np.ones(dense.shape[1])
+        self.scale_ = np.where(std > 0, std, 1.0)
+        self.feature_names_ = np.array(
+            self.numeric_columns_ + self.ordinal_columns_
+            + [f'{col}_{v}' for col in self.onehot_columns_ for v in self.categories_[col]], dtype=object)
+        return self
+
+    def _codes(self, df, col):
+        # -1 for missing values and categories not seen during fit
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # look up each category once instead of every row
+            lookup = np.append(self.categories_[col].get_indexer(values.cat.categories.astype(object)), -1)
+            return lookup[values.cat.codes.to_numpy()]
+        return self.categories_[col].get_indexer(values.astype(object))
+
+    def _dense_block(self, df):
+        dense = np.empty((len(df), len(self.numeric_columns_) + len(self.ordinal_columns_)), dtype=np.float64)
+        for j, col in enumerate(self.numeric_columns_):
+            dense[:, j] = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        for j, col in enumerate(self.ordinal_columns_, start=len(self.numeric_columns_)):
+            dense[:, j] = self._codes(df, col)
+        return dense
+
+    def transform(self, df):
+        n_rows, n_dense = len(df), len(self.numeric_columns_) + len(self.ordinal_columns_)
+        width = n_dense + len(self.onehot_columns_)
+        data = np.empty((n_rows, width), dtype=self.dtype)
+        indices = np.empty((n_rows, width), dtype=np.int32)
+        data[:, :n_dense] = (self._dense_block(df) - self.mean_) / self.scale_
+        indices[:, :n_dense] = np.arange(n_dense)
+        for j, (col, offset) in enumerate(zip(self.onehot_columns_, self.onehot_offsets_), start=n_dense):
+            codes = self._codes(df, col)
+            seen = codes >= 0
+            data[:, j] = seen
+            indices[:, j] = offset + np.where(seen, codes, 0)
+        X = sp.csr_matrix((data.ravel(), indices.ravel(), np.arange(0, n_rows * width + 1, width)),
+                          shape=(n_rows, self.n_features_))
+        X.eliminate_zeros()
+        return X
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
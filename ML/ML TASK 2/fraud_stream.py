@@ -0,0 +1,144 @@
+# fraud_stream.py
+"""Streaming fraud scoring with incremental per-card velocity features.
+
+Transactions are consumed in time order; a card's transaction older than its
+previous one raises ValueError. For every card (cc_num) a VelocityTracker
+keeps the card's recent (unix_time, amt) history once, with a start position,
+count, mean and sum of squared deviations per window (1h, 24h, 7d), kept with
+Welford's updates so the std does not cancel catastrophically the way a
+sum-of-squares formula does. A new transaction moves each window start past
+the entries that fell out and adds itself, so an update is amortized O(1) per
+window no matter how long the stream is; history older than the longest
+window is dropped.
+
+Features describe the card *before* the transaction:
+
+    amt, per window: count, mean amount, amount std, and seconds since the card's previous transaction
+
+StreamingScorer computes features per event and scores them with any fitted
+classifier with predict_proba in micro-batches, which amortizes the model's
+per-call overhead while still emitting one (features, score) record per event.
+"""
+import math
+
+import numpy as np
+
+from fraud_data import iter_fraud_chunks
+
+WINDOWS = {'1h': 3600, '24h': 86400, '7d': 7 * 86400}
+FEATURE_NAMES = ['amt'] + [f'{stat}_{name}' for name in WINDOWS for stat in ('count', 'mean', 'std')] \
+    + ['seconds_since_last']
+EVENT_COLUMNS = ['trans_num', 'cc_num', 'unix_time', 'amt', 'is_fraud']
+# time since last for a card's first transaction
+NO_PREVIOUS = -1.0
+# drop consumed history once this many entries have left every window
+COMPACT_AFTER = 256
+
+
+class CardHistory:
+    __slots__ = ('times', 'amts', 'start', 'count', 'mean', 'm2')
+
+    def __init__(self, n_windows):
+        self.times = []
+        self.amts = []
+        self.start = [0] * n_windows
+        self.count = [0] * n_windows
+        self.mean = [0.0] * n_windows
+        self.m2 = [0.0] * n_windows
+
+
+class VelocityTracker:
+    """Rolling per-card window statistics, updated one transaction at a time."""
+
+    def __init__(self, windows=WINDOWS):
+        self.widths = list(windows.values())
+        self.cards = {}
+
+    def update(self, card, t, amt):
+        """Return the feature list for this transaction, then add it to the card's windows."""
+        history = self.cards.get(card)
+        if history is None:
+            history = self.cards[card] = CardHistory(len(self.widths))
+        times, amts = history.times, history.amts
+        if times and t < times[-1]:
+            raise ValueError(f"Transaction of card {card} at unix_time {t} is earlier than its previous one "
+                             f"at {times[-1]}; events must be in time order")
+        starts, counts, means, m2s = history.start, history.count, history.mean, history.m2
+        features = [amt]
+        for w, width in enumerate(self.widths):
+            start, cutoff = starts[w], t - width
+            count, mean, m2 = counts[w], means[w], m2s[w]
+            while count and times[start] <= cutoff:
+                # Welford removal of the oldest amount
+                old = amts[start]
+                count -= 1
+                start += 1
+                if count:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+            if count:
+                # m2 can drift just below zero after removals; one amount has no spread at all
+                std = math.sqrt(m2 / count) if count > 1 and m2 > 0 else 0.0
+                features += (count, mean, std)
+            else:
+                # an emptied window restarts from exact zeros, so float error never accumulates
+                mean = m2 = 0.0
+                features += (0, 0.0, 0.0)
+            count += 1
+            delta = amt - mean
+            mean += delta / count
+            m2 += delta * (amt - mean)
+            starts[w], counts[w], means[w], m2s[w] = start, count, mean, m2
+        features.append(t - times[-1] if times else NO_PREVIOUS)
+        times.append(t)
+        amts.append(amt)
+
+        # entries before the earliest window start have left every window for good
+        consumed = min(starts)
+        if consumed >= COMPACT_AFTER and consumed * 2 >= len(times):
+            del times[:consumed], amts[:consumed]
+            for w in range(len(starts)):
+                starts[w] -= consumed
+        return features
+
+
+class StreamingScorer:
+    """Velocity features plus a model score for every event, scored in micro-batches."""
+
+    def __init__(self, model=None, tracker=None, batch_size=1024):
+        self.model = model
+        self.tracker = tracker or VelocityTracker()
+        self.batch_size = batch_size
+
+    def score_batch(self, features):
+        X = np.asarray(features, dtype=np.float64)
+        scores = self.model.predict_proba(X)[:, 1] if self.model is not None else np.full(len(X), np.nan)
+        return X, scores
+
+    def process_chunk(self, cards, times, amounts):
+        """Feature matrix and scores for aligned arrays of time-ordered events."""
+        update = self.tracker.update
+        features = [update(card, t, amt) for card, t, amt in zip(cards.tolist(), times.tolist(), amounts.tolist())]
+        blocks = [self.score_batch(features[i:i + self.batch_size]) for i in range(0, len(features), self.batch_size)]
+        if not blocks:
+            return np.empty((0, len(FEATURE_NAMES))), np.empty(0)
+        return np.vstack([b[0] for b in blocks]), np.concatenate([b[1] for b in blocks])
+
+    def process(self, events):
+        """Yield (trans_num, features, score) per event from an iterable of (trans_num, cc_num, unix_time, amt)."""
+        batch_ids, batch_features = [], []
+        update = self.tracker.update
+        for trans_num, card, t, amt in events:
+            batch_ids.append(trans_num)
+            batch_features.append(update(card, t, amt))
+            if len(batch_ids) == self.batch_size:
+                yield from zip(batch_ids, *self.score_batch(batch_features))
+                batch_ids, batch_features = [], []
+        if batch_ids:
+            yield from zip(batch_ids, *self.score_batch(batch_features))
+
+
+def iter_event_chunks(paths, chunksize=200_000):
+    """Typed chunks of just the columns the streaming scorer needs, in file order."""
+    yield from iter_fraud_chunks(paths, chunksize, usecols=EVENT_COLUMNS)
@@ -0,0 +1,156 @@
+# fraud_synth.py
+"""Deterministic synthetic stand-in for fraudTrain.csv / fraudTest.csv.
+
+Writes the same columns in the same order as the Kaggle files, in chunks, so
+any size (100k to 50M rows and beyond) can be generated with bounded memory.
+The same seed always gives the same file. A fixed pool of cardholders
+(with their name, address, job and date of birth) and merchants is drawn
+first; transactions are time-ordered, amounts are log-normal, and frauds are
+rare, larger and come in bursts on a few compromised cards.
+"""
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ['trans_date_trans_time', 'cc_num', 'merchant', 'category', 'amt', 'first', 'last',
+           'gender', 'street', 'city', 'state', 'zip', 'lat', 'long', 'city_pop', 'job', 'dob',
+           'trans_num', 'unix_time', 'merch_lat', 'merch_long', 'is_fraud']
+CATEGORIES = ['gas_transport', 'grocery_pos', 'home', 'shopping_pos', 'kids_pets', 'shopping_net',
+              'entertainment', 'food_dining', 'personal_care', 'health_fitness', 'misc_pos',
+              'misc_net', 'grocery_net', 'travel']
+STATES = ['TX', 'NY', 'PA', 'CA', 'OH', 'MI', 'IL', 'FL', 'AL', 'MO', 'MN', 'AR', 'NC', 'VA', 'WI',
+          'SC', 'KY', 'IN', 'IA', 'OK', 'MD', 'GA', 'WV', 'NJ', 'NE', 'KS', 'MS', 'LA', 'WY', 'WA',
+          'OR', 'TN', 'ME', 'NM', 'ND', 'CO', 'MA', 'SD', 'VT', 'MT', 'AZ', 'UT', 'NH', 'CT', 'NV',
+          'ID', 'DC', 'HI', 'AK', 'RI', 'DE']
+START = int(datetime(2019, 1, 1, tzinfo=timezone.utc).timestamp())
+# fraudTrain.csv + fraudTest.csv, and the test file's share of them
+KAGGLE_ROWS = 1_852_394
+TEST_SHARE = 555_719 / KAGGLE_ROWS
+# transactions per second across all cards, about the rate of the real data
+RATE = 1 / 25
+# default home of generated datasets: the repo's gitignored benchmark data cache
+DATA_DIR = Path(__file__).resolve().parents[2] / "benchmarks" / "bench_data"
+
+
+def make_words(rng, n, low=4, high=9):
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    return np.array(["".join(rng.choice(letters, size=rng.integers(low, high))).title() for _ in range(n)])
+
+
+def make_cards(rng, n_cards):
+    first, last = make_words(rng, 350), make_words(rng, 480)
+    cities, jobs = make_words(rng, 900), make_words(rng, 490)
+    lat = rng.uniform(25, 48, n_cards)
+    lon = rng.uniform(-122, -70, n_cards)
+    dob = START - rng.integers(18 * 365, 90 * 365, n_cards) * 86400
+    return pd.DataFrame({
+        'cc_num': rng.integers(10**11, 5 * 10**18, n_cards, dtype=np.int64),
+        'first': rng.choice(first, n_cards),
+        'last': rng.choice(last, n_cards),
+        'gender': rng.choice(['F', 'M'], n_cards),
+        'street': [f"{n} {w} Street" for n, w in zip(rng.integers(1, 99999, n_cards), make_words(rng, n_cards))],
+        'city': rng.choice(cities, n_cards),
+        'state': rng.choice(STATES, n_cards),
+        'zip': rng.integers(1001, 99950, n_cards),
+        'lat': lat.round(4),
+        'long': lon.round(4),
+        'city_pop': np.exp(rng.uniform(3, 14.5, n_cards)).astype(np.int64),
+        'job': rng.choice(jobs, n_cards),
+        'dob': pd.to_datetime(dob, unit='s').strftime('%Y-%m-%d'),
+    })
+
+
+def make_merchants(rng, n_merchants):
+    return pd.DataFrame({
+        'merchant': [f"fraud_{w}" for w in make_words(rng, n_merchants, 5, 12)],
+        'category': rng.choice(CATEGORIES, n_merchants),
+    })
+
+
+def iter_transactions(n_rows, seed=42, n_cards=1000, n_merchants=700, fraud_rate=0.006, chunk_rows=100_000):
+    """Yield DataFrame chunks of synthetic transactions in the original column order."""
+    rng = np.random.default_rng(seed)
+    cards, merchants = make_cards(rng, n_cards), make_merchants(rng, n_merchants)
+    card_weights = rng.pareto(2.0, n_cards) + 0.2
+    card_weights /= card_weights.sum()
+    clock = float(START)
+    for start in range(0, n_rows, chunk_rows):
+        size = min(chunk_rows, n_rows - start)
+        times = clock + np.cumsum(rng.exponential(1 / RATE, size))
+        clock = times[-1]
+        card = rng.choice(n_cards, size, p=card_weights)
+        fraud = rng.random(size) < fraud_rate
+        # frauds of a chunk land on a handful of compromised cards, so they come in bursts
+        compromised = rng.choice(n_cards, max(1, int(fraud.sum()) // 8 + 1), replace=False)
+        card[fraud] = rng.choice(compromised, fraud.sum())
+        amt = np.where(fraud, rng.lognormal(5.6, 0.9, size), rng.lognormal(3.6, 1.1, size)).round(2)
+
+        chunk = cards.iloc[card].reset_index(drop=True)
+        chunk = pd.concat([chunk, merchants.iloc[rng.integers(0, n_merchants, size)].reset_index(drop=True)], axis=1)
+        seconds = times.astype(np.int64)
+        chunk['trans_date_trans_time'] = pd.to_datetime(seconds, unit='s').strftime('%Y-%m-%d %H:%M:%S')
+        chunk['unix_time'] = seconds
+        chunk['amt'] = amt
+        chunk['merch_lat'] = (chunk['lat'] + rng.uniform(-1, 1, size)).round(6)
+        chunk['merch_long'] = (chunk['long'] + rng.uniform(-1, 1, size)).round(6)
+        hexed = rng.bytes(16 * size).hex()
+        chunk['trans_num'] = [hexed[i:i + 32] for i in range(0, 32 * size, 32)]
+        chunk['is_fraud'] = fraud.astype(np.int8)
+        chunk.index = pd.RangeIndex(start, start + size)
+        yield chunk[COLUMNS]
+
+
+def write_fraud_csv(path, n_rows, seed=42, chunk_rows=100_000, **kwargs):
+    """Write n_rows synthetic transactions to path, one chunk at a time."""
+    for i, chunk in enumerate(iter_transactions(n_rows, seed, chunk_rows=chunk_rows, **kwargs)):
+        # the Kaggle files start with an unnamed row-number column
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0)
+
+
+def write_fraud_dataset(folder, n_rows=KAGGLE_ROWS, seed=42, test_share=TEST_SHARE, chunk_rows=100_000, **kwargs):
+    """Write folder/fraudTrain.csv and folder/fraudTest.csv from one transaction stream.
+
+    The test file continues the train file in time, with the same cards and
+    merchants, and restarts its row numbers like the Kaggle files.
+    Returns (train path, test path).
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    train, test = folder / "fraudTrain.csv", folder / "fraudTest.csv"
+    n_train = n_rows - int(round(n_rows * test_share))
+    written = {train: 0, test: 0}
+    for chunk in iter_transactions(n_rows, seed, chunk_rows=chunk_rows, **kwargs):
+        for path, part in ((train, chunk[chunk.index < n_train]), (test, chunk[chunk.index >= n_train])):
+            if len(part) == 0:
+                continue
+            if path == test:
+                part = part.set_axis(part.index - n_train)
+            part.to_csv(path, mode='w' if written[path] == 0 else 'a', header=written[path] == 0)
+            written[path] += len(part)
+    return train, test
+
+
+def ensure_fraud_dataset(folder, n_rows=KAGGLE_ROWS, seed=42):
+    """Generate the train/test pair in folder unless both files already exist."""
+    train, test = Path(folder) / "fraudTrain.csv", Path(folder) / "fraudTest.csv"
+    if not (train.exists() and test.exists()):
+        print(f"Generating {n_rows:,} synthetic transactions in {folder}...")
+        write_fraud_dataset(folder, n_rows, seed)
+    return train, test
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=KAGGLE_ROWS, help="Number of rows (the Kaggle files have 1,852,394)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=str, default="synthetic_fraud", help="Output folder for fraudTrain.csv / fraudTest.csv")
+    parser.add_argument("--single", action="store_true", help="Write all rows to one CSV at --out instead")
+    args = parser.parse_args()
+    if args.single:
+        write_fraud_csv(args.out, args.rows, args.seed)
+    else:
+        write_fraud_dataset(args.out, args.rows, args.seed)
+    print(f"Wrote {args.rows:,} rows to {args.out}")
@@ -1,95 +1,136 @@
 # ml_task_2.py
-import pandas as pd
-import numpy as np
+import argparse
+import time
 from pathlib import Path
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, accuracy_score, f1_score
+# pandas, sklearn and the fraud_* helpers are imported inside the functions that use them,
+# so --help and argument errors return without loading them
 
 
 # Paths to dataset
 TRAIN_PATH = r"C:\Users\sudsm\Desktop\CodeSoft\CodeSoft Code\ML\ML TASK 2\fraudTrain.csv"
 TEST_PATH = r"C:\Users\sudsm\Desktop\CodeSoft\CodeSoft Code\ML\ML TASK 2\fraudTest.csv"
+CACHE_PATH = Path(TRAIN_PATH).with_name("fraud.parquet")   # typed Parquet copy of both CSVs; None to disable
+# Run with --train/--test to point at other copies, or --synthetic ROWS to use generated data
 
 
-def load_data():
+def load_data(train_path=TRAIN_PATH, test_path=TEST_PATH, cache_path=CACHE_PATH):
+    from fraud_data import load_fraud
+
     print("Loading datasets...")
-    train_df = pd.read_csv(TRAIN_PATH)
-    test_df = pd.read_csv(TEST_PATH)
-    df = pd.concat([train_df, test_df], ignore_index=True)
+    # Typed, chunked read of only the used columns (see fraud_data.py)
+    df = load_fraud([train_path, test_path], cache_path=cache_path)
     print(f"Dataset shape: {df.shape}")
     return df
 
 
 def preprocess_data(df):
-    print("Preprocessing data...")
+    from sklearn.model_selection import train_test_split
+    from fraud_features import FraudEncoder
 
-    # Drop transaction ID and datetime if present
-    drop_cols = ["Unnamed: 0", "trans_date_trans_time", "trans_num"]
-    df = df.drop(columns=[c for c in drop_cols if c in df.columns])
-
-    # Target variable
-    y = df["is_fraud"]
-    X = df.drop(columns=["is_fraud"])
+    print("Preprocessing data...")
 
-    # Identify categorical columns
-    cat_cols = X.select_dtypes(include=["object"]).columns
-    print("Categorical columns detected:", list(cat_cols))
+    # Split first, so the encoder and scaling only ever see the training rows
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42, stratify=df["is_fraud"])
+    y_train, y_test = train_df["is_fraud"], test_df["is_fraud"]
 
-    # Label encode high-cardinality categorical columns, one-hot encode small ones
-    le = LabelEncoder()
-    for col in cat_cols:
-        if X[col].nunique() > 20:   # treat as high-cardinality
-            X[col] = le.fit_transform(X[col])
-        else:
-            dummies = pd.get_dummies(X[col], prefix=col, drop_first=True)
-            X = pd.concat([X.drop(columns=[col]), dummies], axis=1)
+    # Ordinal codes for high-cardinality columns, one-hot for small ones, standardized
+    # numeric columns, all in one sparse matrix (see fraud_features.py)
+    encoder = FraudEncoder(onehot_max=20)
+    X_train = encoder.fit_transform(train_df)
+    X_test = encoder.transform(test_df)
+    print("Ordinal-encoded columns:", encoder.ordinal_columns_)
+    print("One-hot encoded columns:", encoder.onehot_columns_)
 
-    # Normalize numerical features
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    return X_train, X_test, y_train, y_test
 
-    return train_test_split(X_scaled, y, test_size=0.2, random_state=42, stratify=y)
 
+def make_models(n_jobs=None):
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+    from sklearn.ensemble import RandomForestClassifier
 
-def train_and_evaluate(X_train, X_test, y_train, y_test):
-    models = {
+    return {
         "LogisticRegression": LogisticRegression(max_iter=1000, class_weight="balanced", random_state=42),
         "DecisionTree": DecisionTreeClassifier(class_weight="balanced", random_state=42),
-        "RandomForest": RandomForestClassifier(n_estimators=100, class_weight="balanced", random_state=42)
+        "RandomForest": RandomForestClassifier(n_estimators=100, class_weight="balanced", random_state=42, n_jobs=n_jobs)
     }
 
-    best_model, best_score = None, 0
 
-    for name, model in models.items():
-        print(f"\nTraining {name}...")
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
+def make_fast_models(negative_rate=0.1, correction="weight"):
+    """Same models on all frauds plus a sample of the legitimate rows, forest on all cores (see fraud_training.py)."""
+    from fraud_training import DownsampledClassifier
+
+    return {name: DownsampledClassifier(model, negative_rate, correction)
+            for name, model in make_models(n_jobs=-1).items()}
+
+
+def evaluate_model(name, model, X_train, X_test, y_train, y_test):
+    from sklearn.metrics import classification_report, accuracy_score, f1_score
+    from fraud_training import pr_curve
 
-        acc = accuracy_score(y_test, y_pred)
-        f1 = f1_score(y_test, y_pred)
+    print(f"\nTraining {name}...")
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+    y_pred = model.predict(X_test)
 
-        print(f"{name} acc={acc:.4f} f1={f1:.4f}")
-        print(classification_report(y_test, y_pred))
+    acc = accuracy_score(y_test, y_pred)
+    f1 = f1_score(y_test, y_pred)
+    # precision/recall at every threshold in one pass
+    pr = pr_curve(y_test, model.predict_proba(X_test)[:, 1])
 
+    print(f"{name} acc={acc:.4f} f1={f1:.4f} auprc={pr['auprc']:.4f} "
+          f"best_f1={pr['best_f1']:.4f}@{pr['best_threshold']:.3f} fit={fit_seconds:.1f}s")
+    print(classification_report(y_test, y_pred))
+    return {"accuracy": acc, "f1": f1, "auprc": pr["auprc"], "best_f1": pr["best_f1"], "fit_seconds": fit_seconds}
+
+
+def train_and_evaluate(X_train, X_test, y_train, y_test, models=None):
+    best_model, best_score = None, 0
+
+    for name, model in (models or make_models()).items():
+        f1 = evaluate_model(name, model, X_train, X_test, y_train, y_test)["f1"]
         if f1 > best_score:
             best_score = f1
             best_model = name
 
     print(f"\nBest model: {best_model} with F1={best_score:.4f}")
-
-
-def main():
-    assert Path(TRAIN_PATH).exists(), f"{TRAIN_PATH} not found."
-    assert Path(TEST_PATH).exists(), f"{TEST_PATH} not found."
-
-    df = load_data()
+    return best_model, best_score
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Credit card fraud detection")
+    parser.add_argument("--train", type=str, default=TRAIN_PATH, help="fraudTrain.csv path")
+    parser.add_argument("--test", type=str, default=TEST_PATH, help="fraudTest.csv path")
+    parser.add_argument("--cache", type=str, default=None,
+                        help="Parquet cache path (default: fraud.parquet next to the train CSV)")
+    parser.add_argument("--no-cache", action="store_true", help="Always parse the CSVs")
+    parser.add_argument("--synthetic", type=int, default=None, metavar="ROWS",
+                        help="Generate (once) and use a synthetic dataset of ROWS transactions instead")
+    parser.add_argument("--synthetic-dir", type=str, default=None,
+                        help="Where --synthetic data is kept (default: benchmarks/bench_data/fraud_ROWS)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Train on all frauds and a sample of legitimate transactions, forest on all cores")
+    parser.add_argument("--negative-rate", type=float, default=0.1, help="Share of legitimate rows kept with --fast")
+    parser.add_argument("--correction", choices=["weight", "probability"], default="weight",
+                        help="How --fast corrects for the downsampling")
+    return parser.parse_args()
+
+
+def main(args):
+    if args.synthetic:
+        from fraud_synth import DATA_DIR, ensure_fraud_dataset
+        folder = Path(args.synthetic_dir) if args.synthetic_dir else DATA_DIR / f"fraud_{args.synthetic}"
+        args.train, args.test = ensure_fraud_dataset(folder, args.synthetic)
+    assert Path(args.train).exists(), f"{args.train} not found."
+    assert Path(args.test).exists(), f"{args.test} not found."
+    cache_path = None if args.no_cache else (args.cache or Path(args.train).with_name("fraud.parquet"))
+
+    df = load_data(args.train, args.test, cache_path)
     X_train, X_test, y_train, y_test = preprocess_data(df)
-    train_and_evaluate(X_train, X_test, y_train, y_test)
+    models = make_fast_models(args.negative_rate, args.correction) if args.fast else make_models()
+    train_and_evaluate(X_train, X_test, y_train, y_test, models)
 
 
 if __name__ == "__main__":
-    main()
+    main(parse_args())
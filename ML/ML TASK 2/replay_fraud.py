@@ -0,0 +1,94 @@
+# replay_fraud.py
+"""Replay the fraud CSVs through the streaming scorer and measure its throughput.
+
+1. Replays the train CSV in time order to build velocity features (no model yet).
+2. Fits a classifier on those features.
+3. Replays the test CSV through StreamingScorer, carrying on with the card state
+   from the train replay. Every event gets its features and a score, and the
+   sustained events/sec is checked against --target.
+
+Defaults to a synthetic train/test pair from fraud_synth.py.
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import average_precision_score, f1_score
+
+from fraud_stream import FEATURE_NAMES, StreamingScorer, VelocityTracker, iter_event_chunks
+from fraud_synth import DATA_DIR, ensure_fraud_dataset
+
+
+def replay_features(scorer, paths, max_events=None):
+    """Features and labels for every event of paths, plus the events/sec of the feature updates."""
+    features, labels, events, seconds = [], [], 0, 0.0
+    for chunk in iter_event_chunks(paths):
+        if max_events is not None:
+            chunk = chunk.iloc[:max_events - events]
+        start = time.perf_counter()
+        X, _ = scorer.process_chunk(chunk['cc_num'].to_numpy(), chunk['unix_time'].to_numpy(), chunk['amt'].to_numpy())
+        seconds += time.perf_counter() - start
+        features.append(X)
+        labels.append(chunk['is_fraud'].to_numpy())
+        events += len(chunk)
+        if max_events is not None and events >= max_events:
+            break
+    return np.vstack(features), np.concatenate(labels), events / seconds
+
+
+def replay_scores(scorer, paths, max_events=None):
+    """Stream every event through scorer.process; returns (scores, labels, events/sec)."""
+    scores, labels, events, seconds = [], [], 0, 0.0
+    for chunk in iter_event_chunks(paths):
+        if max_events is not None:
+            chunk = chunk.iloc[:max_events - events]
+        stream = zip(chunk['trans_num'].tolist(), chunk['cc_num'].tolist(),
+                     chunk['unix_time'].tolist(), chunk['amt'].tolist())
+        start = time.perf_counter()
+        scores.extend(score for _, _, score in scorer.process(stream))
+        seconds += time.perf_counter() - start
+        labels.append(chunk['is_fraud'].to_numpy())
+        events += len(chunk)
+        if max_events is not None and events >= max_events:
+            break
+    return np.array(scores), np.concatenate(labels), events / seconds
+
+
+def main(args):
+    if args.train and args.test:
+        train, test = Path(args.train), Path(args.test)
+    else:
+        train, test = ensure_fraud_dataset(args.dir)
+
+    tracker = VelocityTracker()
+    print(f"Replaying {train} for training features...")
+    X_train, y_train, feature_rate = replay_features(StreamingScorer(tracker=tracker), train, args.max_events)
+    print(f"  {len(y_train):,} events, features at {feature_rate:,.0f} events/s, {len(tracker.cards):,} cards")
+
+    start = time.perf_counter()
+    model = HistGradientBoostingClassifier(max_iter=200, early_stopping=True, random_state=42)
+    model.fit(X_train, y_train)
+    print(f"Fitted {type(model).__name__} on {FEATURE_NAMES} in {time.perf_counter() - start:.1f}s")
+
+    print(f"Replaying {test} with scoring (micro-batches of {args.batch_size})...")
+    scorer = StreamingScorer(model, tracker=tracker, batch_size=args.batch_size)
+    scores, y_test, rate = replay_scores(scorer, test, args.max_events)
+    print(f"  {len(y_test):,} events at {rate:,.0f} events/s (features + score per event)")
+    print(f"  AUPRC={average_precision_score(y_test, scores):.4f} "
+          f"F1@0.5={f1_score(y_test, scores >= 0.5, zero_division=0):.4f}")
+    status = "meets" if rate >= args.target else "misses"
+    print(f"Throughput {status} the target of {args.target:,} events/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--train", type=str, default=None, help="Train CSV (default: <dir>/fraudTrain.csv)")
+    parser.add_argument("--test", type=str, default=None, help="Test CSV (default: <dir>/fraudTest.csv)")
+    parser.add_argument("--dir", type=str, default=str(DATA_DIR / "fraud_kaggle"),
+                        help="Folder of generated CSVs when no paths are given")
+    parser.add_argument("--batch-size", type=int, default=1024, help="Events per model call")
+    parser.add_argument("--max-events", type=int, default=None, help="Replay at most this many events per file")
+    parser.add_argument("--target", type=int, default=50_000, help="Required events/sec")
+    main(parser.parse_args())
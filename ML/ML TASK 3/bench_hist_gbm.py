@@ -0,0 +1,58 @@
+# bench_hist_gbm.py
+"""Training time, accuracy and F1 of exact vs histogram gradient boosting on churn data at 1x/10x/100x.
+
+The customers are split into train/test first; only the training part is
+scaled up (bootstrap resampling with a little jitter on the continuous
+columns), and every run is scored on the same untouched test customers.
+"""
+import argparse
+import time
+
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from churn_data import ARCHIVE, load_churn, upsample
+from churn_pipeline import CATEGORICAL
+
+
+def codes(X):
+    # What ml_task_3 feeds the exact engine: label-encoded categoricals
+    return X.assign(**{col: X[col].cat.codes for col in CATEGORICAL})
+
+
+def main(archive, scales, exact_max_rows):
+    X, y = load_churn(archive)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    models = {
+        "exact (GradientBoostingClassifier)": (
+            GradientBoostingClassifier(n_estimators=200, learning_rate=0.1, random_state=42), False),
+        "histogram (HistGradientBoostingClassifier)": (
+            HistGradientBoostingClassifier(max_iter=200, learning_rate=0.1, categorical_features="from_dtype",
+                                           early_stopping=True, validation_fraction=0.1, random_state=42), True),
+    }
+
+    print(f"\n{'scale':>6}{'rows':>12}  {'engine':<44}{'fit (s)':>10}{'accuracy':>10}{'F1':>8}")
+    for scale in scales:
+        X_big, y_big = upsample(X_train, y_train, scale)
+        for name, (model, native) in models.items():
+            if not native and exact_max_rows and len(X_big) > exact_max_rows:
+                print(f"{scale:>5}x{len(X_big):>12,}  {name:<44}{'skipped':>10}")
+                continue
+            fit_X, eval_X = (X_big, X_test) if native else (codes(X_big), codes(X_test))
+            start = time.perf_counter()
+            model.fit(fit_X, y_big)
+            fit_time = time.perf_counter() - start
+            y_pred = model.predict(eval_X)
+            print(f"{scale:>5}x{len(X_big):>12,}  {name:<44}{fit_time:>10.2f}"
+                  f"{accuracy_score(y_test, y_pred):>10.4f}{f1_score(y_test, y_pred):>8.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", type=str, default=str(ARCHIVE), help="archive.zip containing Churn_Modelling.csv")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Training set size multipliers")
+    parser.add_argument("--exact-max-rows", type=int, default=0,
+                        help="Skip the exact engine above this many rows (0 = never skip)")
+    args = parser.parse_args()
+    main(args.data, args.scales, args.exact_max_rows)
@@ -0,0 +1,67 @@
+# bench_tree_inference.py
+"""Batch scoring throughput of sklearn predict_proba vs the compiled ensembles (churn_trees.py).
+
+Trains the Random Forest and Gradient Boosting pipelines from ml_task_3 on
+the real churn data, then scores a synthetic customer base (10M rows by
+default): real customers resampled with a little jitter on the continuous
+columns and run through the fitted churn_pipeline preprocessing. Checks that
+both scorers return identical probabilities and reports rows/sec for sklearn
+and for the compiled evaluator at every --block-rows size.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from churn_data import ARCHIVE, load_churn, upsample
+from churn_trees import BLOCK_ROWS, compile_ensemble
+from ml_task_3 import GROWN_MODELS, make_models
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import timed  # noqa: E402
+
+
+def customer_base(X, preprocess, n_rows, chunk_rows=1_000_000, seed=42):
+    """n_rows synthetic customers as one preprocessed float32 matrix, built a chunk at a time."""
+    out = np.empty((n_rows, len(preprocess.get_feature_names_out())), dtype=np.float32)
+    for i, start in enumerate(range(0, n_rows, chunk_rows)):
+        size = min(chunk_rows, n_rows - start)
+        factor = -(-size // len(X))
+        chunk, _ = upsample(X, X.index.to_series(), factor, seed=seed + i)
+        out[start:start + size] = preprocess.transform(chunk.iloc[:size])
+    return out
+
+
+def main(args):
+    X, y = load_churn(args.data)
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    models = make_models()
+    # the two ensembles share the scaled preprocessing, so one base serves both
+    preprocess = models[GROWN_MODELS[0]].named_steps["preprocess"].fit(X_train)
+
+    print(f"Building {args.rows:,} synthetic customers...")
+    base = customer_base(X, preprocess, args.rows)
+
+    print(f"\n{'model':<20}{'trees':>6}{'depth':>6}{'scorer':>18}{'rows/s':>12}{'identical':>11}")
+    for name in GROWN_MODELS:
+        model = models[name].named_steps["model"].fit(preprocess.transform(X_train), y_train)
+        compiled = compile_ensemble(model)
+        expected, seconds = timed(lambda: model.predict_proba(base))
+        print(f"{name:<20}{compiled.n_trees:>6}{compiled.max_depth:>6}{'sklearn':>18}{args.rows / seconds:>12,.0f}")
+        for block_rows in args.block_rows:
+            got, seconds = timed(lambda: compiled.predict_proba(base, block_rows=block_rows))
+            print(f"{'':<32}{f'compiled/{block_rows}':>18}{args.rows / seconds:>12,.0f}"
+                  f"{str(np.array_equal(expected, got)):>11}")
+            del got
+        del expected
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", type=str, default=str(ARCHIVE), help="archive.zip containing Churn_Modelling.csv")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Synthetic customers to score")
+    parser.add_argument("--block-rows", type=int, nargs="+", default=[BLOCK_ROWS],
+                        help="Rows per block in the compiled evaluator (several sizes to compare them)")
+    main(parser.parse_args())
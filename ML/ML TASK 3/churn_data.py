@@ -0,0 +1,33 @@
+# churn_data.py
+"""The bundled churn customers and a scaled-up copy of them for the benchmarks.
+
+load_churn reads archive.zip (or any file with the churn schema, see
+churn_pipeline.load_customers) and returns the model features and target.
+upsample resamples customers with replacement and, when scaling up, puts a
+little multiplicative jitter on the continuous columns so the copies are not
+exact duplicates.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from churn_pipeline import FEATURES, TARGET, load_customers
+
+ARCHIVE = Path(__file__).resolve().parent / "archive.zip"
+CONTINUOUS = ["CreditScore", "Age", "Balance", "EstimatedSalary"]
+
+
+def load_churn(path=ARCHIVE):
+    """(features, target) of the customers in path."""
+    data = load_customers(path)
+    return data[FEATURES], data[TARGET]
+
+
+def upsample(X, y, factor, seed=42):
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(X), len(X) * factor)
+    X_big, y_big = X.iloc[idx].reset_index(drop=True), y.iloc[idx].reset_index(drop=True)
+    if factor > 1:
+        for col in CONTINUOUS:
+            X_big[col] = X_big[col] * rng.normal(1, 0.01, len(X_big))
+    return X_big, y_big
@@ -0,0 +1,97 @@
+# churn_growth.py
+"""Grow the churn ensembles a block of trees at a time instead of refitting fixed sizes.
+
+grow_ensemble turns on warm_start and raises n_estimators by `step` after
+every fit, so each round only trains the new trees. After each block the
+model is scored on a validation fold; growth stops once validation F1 has not
+improved by more than `tol` for `patience` blocks, or at `max_estimators`.
+
+For a Pipeline (the churn_pipeline models) the preprocessing steps are fitted
+once on the training rows and only the final estimator is grown.
+
+grow_cv runs this on every fold of a StratifiedKFold in parallel (joblib) and
+averages the per-fold curves: mean/std F1 and cumulative fit time against
+n_estimators. The best size is the one with the highest mean F1.
+
+class_weight="balanced" is recomputed from the classes seen in each fit call,
+which sklearn warns against with warm_start; balanced_class_weight gives the
+same weights as an explicit dict fixed on the training fold.
+"balanced_subsample" depends on each tree's bootstrap sample, which no fixed
+dict reproduces, so it is rejected.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import f1_score
+from sklearn.model_selection import StratifiedKFold
+from sklearn.pipeline import Pipeline
+
+
+def balanced_class_weight(y):
+    """The weights class_weight="balanced" would use on y, as a fixed dict."""
+    classes, counts = np.unique(y, return_counts=True)
+    return {c: len(y) / (len(classes) * n) for c, n in zip(classes, counts)}
+
+
+def grow_ensemble(model, X_train, y_train, X_val, y_val, step=10, max_estimators=500, patience=3, tol=1e-3):
+    """Fit model in blocks of `step` trees with warm_start; returns (fitted model, curve rows)."""
+    if isinstance(model, Pipeline):
+        preprocess = clone(model[:-1]).fit(X_train, y_train)
+        estimator, curve = grow_ensemble(model[-1], preprocess.transform(X_train), y_train,
+                                         preprocess.transform(X_val), y_val, step, max_estimators, patience, tol)
+        return Pipeline(preprocess.steps + [(model.steps[-1][0], estimator)]), curve
+
+    model = clone(model)
+    class_weight = model.get_params().get('class_weight')
+    if class_weight == 'balanced_subsample':
+        raise ValueError("class_weight='balanced_subsample' cannot be grown with warm_start: its weights depend "
+                         "on each tree's bootstrap sample; use 'balanced' or an explicit dict")
+    if class_weight == 'balanced':
+        model.set_params(class_weight=balanced_class_weight(y_train))
+    model.set_params(warm_start=True, n_estimators=0)
+
+    curve, best, waited, fit_seconds = [], -np.inf, 0, 0.0
+    while model.n_estimators < max_estimators and waited < patience:
+        model.set_params(n_estimators=min(model.n_estimators + step, max_estimators))
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_seconds += time.perf_counter() - start
+        score = f1_score(y_val, model.predict(X_val))
+        curve.append({'n_estimators': model.n_estimators, 'f1': score, 'fit_seconds': fit_seconds})
+        if score > best + tol:
+            best, waited = score, 0
+        else:
+            waited += 1
+    return model, curve
+
+
+def _rows(X, idx):
+    return X.iloc[idx] if isinstance(X, pd.DataFrame) else X[idx]
+
+
+def _grow_fold(model, X, y, train_idx, val_idx, fold, **kwargs):
+    _, curve = grow_ensemble(model, _rows(X, train_idx), y[train_idx], _rows(X, val_idx), y[val_idx], **kwargs)
+    return [{'fold': fold, **row} for row in curve]
+
+
+def grow_cv(model, X, y, n_splits=5, n_jobs=-1, random_state=42, **kwargs):
+    """Grow model on every stratified fold in parallel.
+
+    Returns (per-fold curves, mean curve, best n_estimators); the mean curve
+    only covers sizes that every fold reached before stopping.
+    """
+    X, y = (X if isinstance(X, pd.DataFrame) else np.asarray(X)), np.asarray(y)
+    folds = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X, y)
+    rows = Parallel(n_jobs=n_jobs)(
+        delayed(_grow_fold)(model, X, y, train_idx, val_idx, fold, **kwargs)
+        for fold, (train_idx, val_idx) in enumerate(folds))
+    curves = pd.DataFrame([row for fold_rows in rows for row in fold_rows])
+
+    summary = curves.groupby('n_estimators').agg(
+        f1_mean=('f1', 'mean'), f1_std=('f1', 'std'), fit_seconds=('fit_seconds', 'mean'), folds=('fold', 'count'))
+    summary = summary[summary['folds'] == n_splits].reset_index()
+    best_n = int(summary.loc[summary['f1_mean'].idxmax(), 'n_estimators'])
+    return curves, summary, best_n
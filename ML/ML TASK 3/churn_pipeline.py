@@ -0,0 +1,71 @@
+# churn_pipeline.py
+"""Reusable churn preprocessing + model pipelines and their saved artifact.
+
+The preprocessing is a ColumnTransformer fitted on the training split only:
+Geography and Gender each get their own OrdinalEncoder (categories unseen in
+training map to -1), and for the linear and exact tree models every column is
+then standardized, which matches what ml_task_3 fed them before. Histogram
+gradient boosting gets the unscaled ordinal codes as native categorical
+features.
+
+save_artifact writes the fitted pipeline together with the input columns and
+scores it was selected on; score_churn.py loads it to score new customers.
+"""
+from pathlib import Path
+
+import joblib
+import pandas as pd
+import sklearn
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
+
+TARGET = "Exited"
+ID_COLUMNS = ["RowNumber", "CustomerId", "Surname"]
+CATEGORICAL = ["Geography", "Gender"]
+NUMERIC = ["CreditScore", "Age", "Tenure", "Balance", "NumOfProducts", "HasCrCard", "IsActiveMember",
+           "EstimatedSalary"]
+FEATURES = CATEGORICAL + NUMERIC
+DTYPES = {**{col: "category" for col in CATEGORICAL}, **{col: "float64" for col in NUMERIC}}
+ARTIFACT_VERSION = 1
+
+
+def load_customers(path, **read_csv_kwargs):
+    """Read a customer CSV (or a zip holding one) with the churn schema."""
+    return pd.read_csv(path, dtype={col: dtype for col, dtype in DTYPES.items()}, **read_csv_kwargs)
+
+
+def make_preprocessor(scale=True):
+    """Per-column ordinal encoding of the categoricals, optionally followed by standardization of everything."""
+    encoder = OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1)
+    if scale:
+        encoder = Pipeline([("encode", encoder), ("scale", StandardScaler())])
+    return ColumnTransformer(
+        [("categorical", encoder, CATEGORICAL),
+         ("numeric", StandardScaler() if scale else "passthrough", NUMERIC)],
+        verbose_feature_names_out=False)
+
+
+def make_pipeline(model, scale=True):
+    return Pipeline([("preprocess", make_preprocessor(scale)), ("model", model)])
+
+
+def save_artifact(pipeline, path, name, scores=None):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump({
+        "version": ARTIFACT_VERSION,
+        "name": name,
+        "pipeline": pipeline,
+        "features": FEATURES,
+        "scores": scores or {},
+        "sklearn_version": sklearn.__version__,
+    }, path)
+    return path
+
+
+def load_artifact(path):
+    artifact = joblib.load(path)
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported churn artifact version {artifact.get('version')}")
+    return artifact
@@ -0,0 +1,220 @@
+# churn_trees.py
+"""Fitted tree ensembles as flat node arrays, with a vectorized batch evaluator.
+
+compile_ensemble turns a fitted RandomForestClassifier or binary
+GradientBoostingClassifier into one set of arrays covering every node of every
+tree (feature, threshold, left/right child, leaf value), with the trees laid
+out back to back. CompiledEnsemble.predict_proba then walks all trees for a
+block of rows together: each step moves every (tree, row) pair one level down,
+so the Python loop runs once per tree level, not per row or per tree. Leaves
+point to themselves, so pairs that reach a leaf early just stay there until
+more than half of the pairs are done and the finished ones are dropped. Pairs
+are ordered tree by tree, so neighbouring pairs read the same tree's nodes,
+and the leaf values of all trees are gathered and summed in one pass.
+
+Results are bit-for-bit the same as sklearn's predict_proba:
+  * X is cast to float32, as sklearn does, and compared with each float64 threshold
+    rounded down to float32, which splits the same way;
+  * forest probabilities are summed tree by tree in estimator order (a sequential
+    np.add.accumulate over the tree axis, not a pairwise sum), then divided by
+    the number of trees;
+  * boosting starts from the init estimator's prior log-odds and adds
+    learning_rate * leaf value stage by stage, then applies the logistic function.
+
+Compiled ensembles are saved as a single .npz and need only numpy/scipy to score.
+"""
+from pathlib import Path
+
+import numpy as np
+from scipy.special import expit, logit
+
+DTYPE = np.float32
+FORMAT_VERSION = 1
+# rows scored together; larger blocks help deep forests and hurt shallow boosting
+# once the walk's index arrays leave the cache (bench_tree_inference.py --block-rows)
+BLOCK_ROWS = 1024
+
+
+def float32_floor(threshold):
+    """Largest float32 <= each float64 threshold.
+
+    For a float32 x, x <= t holds exactly when x <= float32_floor(t), so the
+    walk can compare in float32 and still split exactly like sklearn.
+    """
+    t32 = threshold.astype(np.float32)
+    over = t32.astype(np.float64) > threshold
+    t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+    return t32
+
+
+def _tree_arrays(tree, offset):
+    """Node arrays of one sklearn tree_, with child ids shifted by offset and leaves pointing to themselves."""
+    nodes = np.arange(tree.node_count)
+    leaf = tree.children_left == -1
+    left = np.where(leaf, nodes, tree.children_left) + offset
+    right = np.where(leaf, nodes, tree.children_right) + offset
+    feature = np.where(leaf, 0, tree.feature).astype(np.intp)
+    # +inf keeps leaves on their "left" (themselves) branch for any finite value
+    threshold = np.where(leaf, np.inf, tree.threshold)
+    missing_left = np.asarray(getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count, dtype=np.uint8)), dtype=bool)
+    return feature, threshold, left.astype(np.intp), right.astype(np.intp), missing_left, tree.max_depth
+
+
+def compile_ensemble(model):
+    """Return a CompiledEnsemble equivalent to a fitted forest or binary gradient boosting classifier."""
+    kind = type(model).__name__
+    if kind in ('RandomForestClassifier', 'ExtraTreesClassifier'):
+        trees = [est.tree_ for est in model.estimators_]
+        # classifier trees store class fractions per node; predict_proba returns them as they are
+        values = [t.value[:, 0, :] for t in trees]
+        init = np.zeros(len(model.classes_))
+        ensemble_kind = 'forest'
+    elif kind == 'GradientBoostingClassifier':
+        if len(model.classes_) != 2:
+            raise ValueError("Only binary gradient boosting is supported")
+        trees = [est.tree_ for est in model.estimators_[:, 0]]
+        values = [model.learning_rate * t.value[:, 0, :] for t in trees]
+        if isinstance(model.init_, str):  # init='zero'
+            init = np.zeros(1)
+        elif type(model.init_).__name__ == 'DummyClassifier':
+            # prior probability -> log-odds, clipped and linked exactly like sklearn's _init_raw_predictions
+            prior = model.init_.predict_proba(np.zeros((1, model.n_features_in_)))[:, 1]
+            eps = np.finfo(np.float64).eps
+            init = logit(np.clip(prior, eps, 1 - eps, dtype=np.float64))
+        else:
+            raise ValueError(f"Unsupported init estimator {type(model.init_).__name__}")
+        ensemble_kind = 'boosting'
+    else:
+        raise ValueError(f"Cannot compile {kind}")
+
+    offsets = np.cumsum([0] + [t.node_count for t in trees])
+    parts = [_tree_arrays(t, off) for t, off in zip(trees, offsets[:-1])]
+    return CompiledEnsemble(
+        kind=ensemble_kind,
+        classes=np.asarray(model.classes_),
+        feature=np.concatenate([p[0] for p in parts]),
+        threshold=np.concatenate([p[1] for p in parts]),
+        left=np.concatenate([p[2] for p in parts]),
+        right=np.concatenate([p[3] for p in parts]),
+        missing_left=np.concatenate([p[4] for p in parts]),
+        value=np.concatenate(values).astype(np.float64),
+        roots=offsets[:-1].astype(np.intp),
+        init=np.asarray(init, dtype=np.float64),
+        max_depth=max(p[5] for p in parts),
+        n_features=model.n_features_in_,
+    )
+
+
+class CompiledEnsemble:
+    """Flat-array tree ensemble; see compile_ensemble and the module docstring."""
+
+    ARRAYS = ('classes', 'feature', 'threshold', 'left', 'right', 'missing_left', 'value', 'roots', 'init')
+
+    def __init__(self, kind, classes, feature, threshold, left, right, missing_left, value, roots, init,
+                 max_depth, n_features):
+        self.kind = kind
+        self.classes = classes
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.init = init
+        self.max_depth = int(max_depth)
+        self.n_features = int(n_features)
+        self.is_leaf = left == np.arange(len(left))
+        # children[2 * node] is the left child, children[2 * node + 1] the right one
+        self.children = np.column_stack([left, right]).ravel()
+        self.threshold32 = float32_floor(threshold)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def leaves(self, X):
+        """Leaf node id reached in every tree, shape (n_trees, n_rows), for a float32 block X."""
+        n_rows = X.shape[0]
+        flat = X.ravel()
+        # the (tree, row) pairs still walking: current node and row offset in X; once more than
+        # half are at a leaf, the finished ones are written to out (at their slot) and dropped,
+        # so deep, unbalanced trees cost about what they use without compacting every level
+        node = np.repeat(self.roots, n_rows)
+        row = np.tile(np.arange(n_rows, dtype=np.intp) * self.n_features, self.n_trees)
+        out, slot = None, None
+        check_missing = np.isnan(flat).any()
+        for _ in range(self.max_depth):
+            x = flat[row + self.feature[node]]
+            go_right = x > self.threshold32[node]
+            if check_missing:
+                missing = np.isnan(x)
+                go_right[missing] = ~self.missing_left[node[missing]]
+            node = self.children[2 * node + go_right]
+            done = self.is_leaf[node]
+            n_done = np.count_nonzero(done)
+            if n_done == len(node):
+                break
+            if 2 * n_done > len(node):
+                keep = ~done
+                if slot is None:
+                    out, slot = node.copy(), np.flatnonzero(keep)
+                else:
+                    out[slot[done]] = node[done]
+                    slot = slot[keep]
+                node, row = node[keep], row[keep]
+        if slot is not None:
+            out[slot] = node
+            node = out
+        return node.reshape(self.n_trees, n_rows)
+
+    def _block_scores(self, X):
+        """Summed leaf values in estimator order: class probabilities (forest) or raw log-odds (boosting)."""
+        values = self.value[self.leaves(X)]
+        if self.kind == 'boosting':
+            values[0] += self.init
+        # accumulate adds tree t+1 to the running sum of trees 0..t, the order sklearn uses
+        scores = np.add.accumulate(values, axis=0, out=values)[-1]
+        if self.kind == 'forest':
+            scores /= self.n_trees
+        return scores
+
+    def _scores(self, X, block_rows):
+        X = np.asarray(X, dtype=DTYPE)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"Expected an array with {self.n_features} columns")
+        out = np.empty((X.shape[0], len(self.classes) if self.kind == 'forest' else 1))
+        for start in range(0, X.shape[0], block_rows):
+            block = np.ascontiguousarray(X[start:start + block_rows])
+            out[start:start + len(block)] = self._block_scores(block)
+        return out
+
+    def decision_function(self, X, block_rows=BLOCK_ROWS):
+        if self.kind != 'boosting':
+            raise AttributeError("decision_function is only available for boosting ensembles")
+        return self._scores(X, block_rows)[:, 0]
+
+    def predict_proba(self, X, block_rows=BLOCK_ROWS):
+        scores = self._scores(X, block_rows)
+        if self.kind == 'forest':
+            return scores
+        pos = expit(scores[:, 0])
+        return np.column_stack([1 - pos, pos])
+
+    def predict(self, X, block_rows=BLOCK_ROWS):
+        if self.kind == 'boosting':
+            return self.classes[(self.decision_function(X, block_rows) >= 0).astype(int)]
+        return self.classes[np.argmax(self.predict_proba(X, block_rows), axis=1)]
+
+    def save(self, path):
+        np.savez(path, format_version=FORMAT_VERSION, kind=self.kind, max_depth=self.max_depth,
+                 n_features=self.n_features, **{name: getattr(self, name) for name in self.ARRAYS})
+        return Path(path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported compiled ensemble format {int(data['format_version'])}")
+            return cls(kind=str(data['kind']), max_depth=int(data['max_depth']), n_features=int(data['n_features']),
+                       **{name: data[name] for name in cls.ARRAYS})
@@ -0,0 +1,67 @@
+# grow_churn.py
+"""Pick the churn ensembles' sizes by incremental growth with early stopping (churn_growth.py).
+
+For the Random Forest and Gradient Boosting models of ml_task_3, grows each
+one block of trees at a time on every fold of a stratified K-fold split of
+the training customers, prints mean validation F1 and cumulative fit time
+against n_estimators, then refits at the best size and scores the held-out
+test customers. The curves are written to a CSV for plotting.
+
+The models are ml_task_3's pipelines, so every fold fits the churn_pipeline
+preprocessing on its own training rows before growing the trees.
+"""
+import argparse
+import time
+
+import pandas as pd
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+
+from churn_data import ARCHIVE, load_churn
+from churn_growth import grow_cv
+from ml_task_3 import GROWN_MODELS, make_models
+
+
+def main(args):
+    X, y = load_churn(args.data)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+
+    models = make_models()
+    all_curves = []
+    for name in GROWN_MODELS:
+        model = models[name]
+        print(f"\nGrowing {name} ({args.folds} folds, +{args.step} trees per block, patience {args.patience})...")
+        start = time.perf_counter()
+        curves, summary, best_n = grow_cv(model, X_train, y_train, n_splits=args.folds, n_jobs=args.n_jobs,
+                                          step=args.step, max_estimators=args.max_estimators,
+                                          patience=args.patience, tol=args.tol)
+        search_seconds = time.perf_counter() - start
+        print(f"{'trees':>6}{'F1 mean':>9}{'F1 std':>8}{'fit (s)':>9}")
+        for row in summary.itertuples():
+            print(f"{row.n_estimators:>6}{row.f1_mean:>9.4f}{row.f1_std:>8.4f}{row.fit_seconds:>9.2f}"
+                  f"{'  <- best' if row.n_estimators == best_n else ''}")
+        stopped = curves.groupby('fold')['n_estimators'].max()
+        print(f"Folds stopped at {', '.join(map(str, stopped))} trees; search took {search_seconds:.1f}s")
+
+        final = model.set_params(model__n_estimators=best_n).fit(X_train, y_train)
+        y_pred = final.predict(X_test)
+        print(f"{name} @ {best_n} trees -> Accuracy: {accuracy_score(y_test, y_pred):.4f}, "
+              f"F1 Score: {f1_score(y_test, y_pred):.4f}")
+        all_curves.append(curves.assign(model=name))
+
+    if args.curves:
+        pd.concat(all_curves).to_csv(args.curves, index=False)
+        print(f"\nCurves written to {args.curves}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", type=str, default=str(ARCHIVE), help="archive.zip containing Churn_Modelling.csv")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--step", type=int, default=10, help="Trees added per block")
+    parser.add_argument("--max-estimators", type=int, default=500)
+    parser.add_argument("--patience", type=int, default=3, help="Blocks without F1 improvement before stopping")
+    parser.add_argument("--tol", type=float, default=1e-3, help="Minimum F1 gain that counts as improvement")
+    parser.add_argument("--n-jobs", type=int, default=-1, help="Folds grown in parallel")
+    parser.add_argument("--curves", type=str, default="churn_growth_curves.csv", help="CSV of per-fold curves ('' to skip)")
+    main(parser.parse_args())
@@ -0,0 +1,60 @@
+# score_churn.py
+"""Score a customer CSV of any size with a saved churn pipeline (ml_task_3 --artifact).
+
+The input is read in chunks of --chunksize rows; each chunk is scored and its
+churn probabilities are appended to the output CSV before the next chunk is
+read, so memory stays bounded by the chunk size. Prints rows/sec and peak RSS
+at the end (and per chunk with --verbose).
+
+    python score_churn.py customers.csv churn_scores.csv --artifact churn_model.joblib
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "benchmarks"))
+from benchutil import fmt_mb, peak_mb  # noqa: E402
+
+
+def score_file(artifact, source, destination, chunksize=100_000, id_column="CustomerId", verbose=False):
+    """Stream source through the pipeline into destination; returns (rows scored, seconds)."""
+    from churn_pipeline import load_customers
+
+    pipeline, features = artifact["pipeline"], artifact["features"]
+    rows, start = 0, time.perf_counter()
+    with open(destination, "w", newline="") as out:
+        for i, chunk in enumerate(load_customers(source, chunksize=chunksize)):
+            missing = set(features) - set(chunk.columns)
+            if missing:
+                raise ValueError(f"{source} is missing columns: {', '.join(sorted(missing))}")
+            scores = chunk[[id_column]] if id_column in chunk.columns else chunk.iloc[:, :0].copy()
+            scores = scores.assign(churn_probability=pipeline.predict_proba(chunk[features])[:, 1])
+            scores.to_csv(out, header=(i == 0), index=False)
+            rows += len(chunk)
+            if verbose:
+                elapsed = time.perf_counter() - start
+                print(f"chunk {i + 1}: {rows:,} rows, {rows / elapsed:,.0f} rows/sec, peak RSS {fmt_mb(peak_mb(), 0)} MB")
+    return rows, time.perf_counter() - start
+
+
+def main(args):
+    # pandas/sklearn come in with the artifact, after the arguments are parsed
+    from churn_pipeline import load_artifact
+
+    artifact = load_artifact(args.artifact)
+    print(f"Scoring {args.source} with {artifact['name']} (trained F1 {artifact['scores'].get('f1', float('nan')):.4f})")
+    rows, seconds = score_file(artifact, args.source, args.destination, args.chunksize, args.id_column, args.verbose)
+    print(f"Scored {rows:,} rows in {seconds:.1f}s ({rows / seconds:,.0f} rows/sec), "
+          f"peak RSS {fmt_mb(peak_mb(), 0)} MB -> {args.destination}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("source", help="Customer CSV with the Churn_Modelling columns (Exited is not needed)")
+    parser.add_argument("destination", help="Output CSV of churn probabilities")
+    parser.add_argument("--artifact", type=str, default="churn_model.joblib", help="Pipeline saved by ml_task_3.py")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows read and scored at a time")
+    parser.add_argument("--id-column", type=str, default="CustomerId", help="Input column copied next to each score")
+    parser.add_argument("--verbose", action="store_true", help="Report progress after every chunk")
+    main(parser.parse_args())
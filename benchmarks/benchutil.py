@@ -0,0 +1,50 @@
+# benchutil.py
+"""Timing and peak-memory helpers shared by the benchmark harness and the per-task bench scripts.
+
+The task folders are not packages, so their bench scripts put this folder on
+sys.path and import from here.
+"""
+import sys
+import time
+
+
+def peak_mb():
+    """Peak RSS of this process in MB, or None where the platform does not report it."""
+    # VmHWM starts fresh in an exec'd worker; ru_maxrss also carries the parent's peak
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmHWM")) / 1024
+    except (OSError, StopIteration):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # ru_maxrss is in bytes on macOS and in KB elsewhere
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 ** 2 if sys.platform == "darwin" else 1024)
+
+
+def mb_diff(after, before):
+    """after - before, or None if either peak is unknown."""
+    return None if after is None or before is None else after - before
+
+
+def fmt_mb(value, width):
+    """value right-aligned in width as whole MB, or 'n/a' when the peak is unknown."""
+    return f"{'n/a':>{width}}" if value is None else f"{value:>{width}.0f}"
+
+
+def timed(func, *args, **kwargs):
+    """(func(*args, **kwargs), seconds it took)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def best_of(func, repeat=3):
+    """(result of the last call, shortest of repeat timings of func()), for sub-second measurements."""
+    best = float("inf")
+    for _ in range(repeat):
+        result, seconds = timed(func)
+        best = min(best, seconds)
+    return result, best
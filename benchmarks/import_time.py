@@ -0,0 +1,132 @@
+# import_time.py
+"""Startup cost of every task entry point, measured with python -X importtime.
+
+Each entry point is started --repeat times in a fresh interpreter: scripts
+with a command line are run with --help, the interactive ones (chatbot,
+tic-tac-toe) are only imported. For each run we record the wall time of the
+whole process and the import time reported by -X importtime (the sum of the
+cumulative times of the top-level imports); the median run is reported with
+its slowest top-level imports.
+
+Medians are checked against the budgets in startup_budget.json (milliseconds
+of import time per entry point) and the script exits with status 1 when one
+is over budget. --update-budget rewrites the file from the current run with
+--headroom to spare (never below --min-budget, so a few ms of noise on a
+light script does not fail the check).
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_PATH = Path(__file__).resolve().parent / "startup_budget.json"
+
+# name -> (script relative to the repo root, how it is started)
+ENTRY_POINTS = {
+    "ai_task_1": ("AI/AI TASK 1/ai_task_1.py", "import"),
+    "ai_task_2": ("AI/AI TASK 2/ai_task_2.py", "import"),
+    "ai_task_5": ("AI/AI TASK 5/ai_task_5.py", "help"),
+    "ds_task_1": ("Data Science/Data Science Task 1/ds_task_1.py", "help"),
+    "ds_task_2": ("Data Science/Data Science Task 2/ds_task_2.py", "help"),
+    "ds_task_4": ("Data Science/Data Science Task 4/ds_task_4.py", "help"),
+    "ml_task_1": ("ML/ML TASK 1/ml_task_1.py", "help"),
+    "ml_task_2": ("ML/ML TASK 2/ml_task_2.py", "help"),
+    "ml_task_3": ("ML/ML TASK 3/ml_task_3.py", "help"),
+    "score_churn": ("ML/ML TASK 3/score_churn.py", "help"),
+}
+
+
+def parse_importtime(stderr):
+    """Top-level imports as {module: cumulative microseconds} from -X importtime output."""
+    top = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented by two spaces per level
+        if not name[1:].startswith(" "):
+            top[name.strip()] = top.get(name.strip(), 0) + int(cumulative)
+    return top
+
+
+def measure(script, mode):
+    """One cold start of script; returns wall ms, import ms and the top-level imports, or an error."""
+    path = ROOT / script
+    if mode == "help":
+        cmd = [sys.executable, "-X", "importtime", str(path), "--help"]
+    else:
+        cmd = [sys.executable, "-X", "importtime", "-c", f"import {path.stem}"]
+    start = time.perf_counter()
+    out = subprocess.run(cmd, cwd=path.parent, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if out.returncode != 0:
+        error = [line for line in out.stderr.splitlines() if not line.startswith("import time:")]
+        return {"error": error[-1] if error else f"exit status {out.returncode}"}
+    top = parse_importtime(out.stderr)
+    return {"wall_ms": wall_ms, "import_ms": sum(top.values()) / 1000, "top": top}
+
+
+def run_entry_point(script, mode, repeat):
+    runs = [measure(script, mode) for _ in range(repeat)]
+    if any("error" in r for r in runs):
+        return next(r for r in runs if "error" in r)
+    median = sorted(runs, key=lambda r: r["import_ms"])[len(runs) // 2]
+    slowest = sorted(median["top"].items(), key=lambda item: -item[1])[:5]
+    return {
+        "wall_ms": statistics.median(r["wall_ms"] for r in runs),
+        "import_ms": median["import_ms"],
+        "slowest": {name: us / 1000 for name, us in slowest},
+    }
+
+
+def main(args):
+    names = args.entry_points or list(ENTRY_POINTS)
+    budget = json.loads(BUDGET_PATH.read_text()) if BUDGET_PATH.exists() else {}
+
+    results, over = {}, []
+    print(f"{'entry point':<14}{'wall (ms)':>11}{'imports (ms)':>14}{'budget (ms)':>13}  slowest top-level imports")
+    for name in names:
+        script, mode = ENTRY_POINTS[name]
+        r = results[name] = run_entry_point(script, mode, args.repeat)
+        if "error" in r:
+            print(f"{name:<14}  failed to start: {r['error']}")
+            continue
+        limit = budget.get(name)
+        flag = ""
+        if limit is not None and r["import_ms"] > limit:
+            over.append(name)
+            flag = "  OVER"
+        slowest = ", ".join(f"{module} {ms:.0f}" for module, ms in r["slowest"].items())
+        print(f"{name:<14}{r['wall_ms']:>11.0f}{r['import_ms']:>14.0f}"
+              f"{limit if limit is not None else '-':>13}  {slowest}{flag}")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(results, indent=2))
+        print(f"\nReport written to {args.report}")
+    if args.update_budget:
+        budget.update({name: max(round(r["import_ms"] * args.headroom), args.min_budget)
+                       for name, r in results.items() if "error" not in r})
+        BUDGET_PATH.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"Budgets written to {BUDGET_PATH}")
+    elif over:
+        print(f"\nOver the startup budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("entry_points", nargs="*", help=f"Entry points to measure (default: all of {', '.join(ENTRY_POINTS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Cold starts per entry point")
+    parser.add_argument("--report", type=str, default=None, help="Also write the results to this JSON file")
+    parser.add_argument("--update-budget", action="store_true", help="Store the current import times as the budgets")
+    parser.add_argument("--headroom", type=float, default=1.5, help="Budget = import time x headroom when updating")
+    parser.add_argument("--min-budget", type=int, default=100, help="Smallest budget (ms) written when updating")
+    args = parser.parse_args()
+    unknown = set(args.entry_points) - set(ENTRY_POINTS)
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+    main(args)
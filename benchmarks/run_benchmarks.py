@@ -0,0 +1,188 @@
+# run_benchmarks.py
+"""One benchmark runner for every task in the repo (workloads in workloads.py).
+
+Each benchmark runs in its own process, so imports, caches and peak memory do
+not leak from one task into the next. The process records the wall time of
+the workload, its peak RSS and the workload's own metrics (responses/sec,
+nodes/sec, frames/sec, fit and predict seconds, ...). With
+--profile DIR it also runs under cProfile, writes DIR/<name>.prof and prints
+the slowest functions. With --sampler, if py-spy is installed, it records
+a flame graph DIR/<name>.svg instead.
+
+Results go to a JSON report, and every shared metric is compared with a
+baseline report: --baseline, else the stored baseline.json (written by
+--save-baseline), else the previous --report. Slower times, larger peak RSS
+and lower throughput beyond --tolerance are flagged, and the exit status is
+1 so a CI job can fail on them. Profiled runs are not compared.
+
+    python benchmarks/run_benchmarks.py                    # all tasks, compare with the last run
+    python benchmarks/run_benchmarks.py churn fraud --scale 4 --profile profiles
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchutil import fmt_mb, peak_mb
+
+HERE = Path(__file__).resolve().parent
+BASELINE_PATH = HERE / "baseline.json"
+# timings this short are mostly noise, so they are reported but not compared
+MIN_SECONDS = 0.05
+NAMES = ["chatbot", "tictactoe", "face", "titanic", "imdb", "genres", "fraud", "churn"]
+
+
+def run_worker(name, scale, data_dir, profile_dir):
+    from workloads import WORKLOADS, Unavailable
+
+    task, workload = WORKLOADS[name]
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    record = {"task": task}
+    start = time.perf_counter()
+    try:
+        if profile_dir:
+            import cProfile
+            import io
+            import pstats
+
+            profiler = cProfile.Profile()
+            metrics = profiler.runcall(workload, scale, data_dir)
+            path = Path(profile_dir) / f"{name}.prof"
+            profiler.dump_stats(path)
+            text = io.StringIO()
+            pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(15)
+            print(text.getvalue(), file=sys.stderr)
+            record["profile"] = str(path)
+        else:
+            metrics = workload(scale, data_dir)
+        record.update(status="ok", seconds=time.perf_counter() - start, peak_rss_mb=peak_mb(), metrics=metrics)
+    except Unavailable as e:
+        record.update(status="skipped", reason=str(e))
+    print(json.dumps(record))
+
+
+def run_benchmark(name, args):
+    cmd = [sys.executable, __file__, "--worker", name, "--scale", str(args.scale), "--data-dir", args.data_dir]
+    if args.profile:
+        Path(args.profile).mkdir(parents=True, exist_ok=True)
+        if args.sampler:
+            if shutil.which("py-spy") is None:
+                print("py-spy is not installed; running without the sampling profiler", file=sys.stderr)
+            else:
+                cmd = ["py-spy", "record", "-o", str(Path(args.profile) / f"{name}.svg"), "--"] + cmd
+        else:
+            cmd += ["--profile", args.profile]
+    # the workers' stderr (progress, warnings, profiles) goes straight to the terminal
+    out = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, cwd=HERE)
+    if out.returncode != 0:
+        return {"status": "failed", "reason": f"exit status {out.returncode}"}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def direction(metric):
+    """+1 if higher is better, -1 if lower is better, 0 if the metric is not compared."""
+    key = metric.split(":", 1)[0]
+    if key.endswith("_per_sec"):
+        return 1
+    if key.endswith("seconds") or key.endswith("_mb"):
+        return -1
+    return 0
+
+
+def flatten(result):
+    return {"seconds": result["seconds"], "peak_rss_mb": result["peak_rss_mb"], **result["metrics"]}
+
+
+def compare(results, baseline, tolerance):
+    """Print every compared metric next to the baseline run; returns the number of regressions."""
+    previous = {name: r for name, r in baseline["results"].items() if r.get("status") == "ok"}
+    regressions = 0
+    print(f"\nCompared with the run of {baseline['created']} (ratio > 1 is worse):")
+    print(f"{'benchmark':<11}{'metric':<48}{'baseline':>12}{'now':>12}{'ratio':>8}")
+    for name, r in results.items():
+        if r.get("status") != "ok" or name not in previous:
+            continue
+        old = flatten(previous[name])
+        for metric, value in flatten(r).items():
+            sign = direction(metric)
+            if not sign or not old.get(metric) or not value:
+                continue
+            if sign < 0 and metric.split(":", 1)[0].endswith("seconds") and max(old[metric], value) < MIN_SECONDS:
+                continue
+            ratio = old[metric] / value if sign > 0 else value / old[metric]
+            worse = ratio > 1 + tolerance
+            regressions += worse
+            print(f"{name:<11}{metric:<48}{old[metric]:>12.4g}{value:>12.4g}{ratio:>8.2f}"
+                  f"{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def main(args):
+    report_path = Path(args.report)
+    baseline_path = Path(args.baseline) if args.baseline else BASELINE_PATH if BASELINE_PATH.exists() else report_path
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+
+    results = {}
+    print(f"{'benchmark':<11}{'task':<13}{'status':<9}{'wall (s)':>10}{'peak RSS (MB)':>15}  headline")
+    for name in args.benchmarks or NAMES:
+        r = results[name] = run_benchmark(name, args)
+        if r["status"] != "ok":
+            print(f"{name:<11}{r.get('task', ''):<13}{r['status']:<9}  {r.get('reason', '')}")
+            continue
+        rates = {k: v for k, v in r["metrics"].items() if direction(k) > 0}
+        fits = {k: v for k, v in r["metrics"].items() if k.startswith("fit_seconds:")}
+        headline = ", ".join(f"{k} {v:,.0f}" for k, v in rates.items())
+        if fits:
+            headline = f"fit {sum(fits.values()):.1f}s over {len(fits)} models"
+        print(f"{name:<11}{r['task']:<13}{r['status']:<9}{r['seconds']:>10.2f}{fmt_mb(r['peak_rss_mb'], 15)}  {headline}")
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": args.scale,
+        "results": results,
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+    print(f"\nReport written to {report_path}")
+    if args.save_baseline:
+        BASELINE_PATH.write_text(json.dumps(report, indent=2))
+        print(f"Stored as the baseline in {BASELINE_PATH}")
+    elif args.profile:
+        print("Profiled run; timings include profiler overhead and are not compared.")
+    elif baseline is not None:
+        if baseline.get("scale") != args.scale:
+            print(f"Baseline was run at scale {baseline.get('scale')}, not {args.scale}; not comparing.")
+        elif compare(results, baseline, args.tolerance):
+            print(f"\nSome metrics are more than {args.tolerance:.0%} worse than the baseline.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(NAMES)})")
+    parser.add_argument("--scale", type=int, default=1, help="Workload size multiplier")
+    parser.add_argument("--data-dir", type=str, default=str(HERE / "bench_data"), help="Where generated datasets are kept")
+    parser.add_argument("--report", type=str, default=str(HERE / "benchmarks.json"), help="JSON report to write")
+    parser.add_argument("--baseline", type=str, default=None, help="Report to compare with (default: the previous --report)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown / memory growth")
+    parser.add_argument("--profile", type=str, default=None, metavar="DIR", help="Profile each benchmark into DIR")
+    parser.add_argument("--sampler", action="store_true", help="With --profile, use py-spy instead of cProfile")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.scale, args.data_dir, args.profile)
+    else:
+        unknown = set(args.benchmarks) - set(NAMES)
+        if unknown:
+            parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+        main(args)
@@ -0,0 +1,224 @@
+# workloads.py
+"""The hot path of every task, as one function per benchmark (see run_benchmarks.py).
+
+Each workload takes (scale, data_dir), imports its task's modules from the
+task folder, builds or generates its input untimed, times the hot path and
+returns a flat dict of metrics:
+
+    *_per_sec   throughput, higher is better
+    *_seconds   time, lower is better
+    anything else is reported but not compared
+
+Generated datasets are written to data_dir once and reused by later runs.
+A workload raises Unavailable when its task's dependencies are not installed.
+ds_task_4 runs ds_task_2's pipeline, so the ds_task_2 workload covers both.
+"""
+import sys
+from pathlib import Path
+
+from benchutil import best_of, timed
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Unavailable(Exception):
+    """The task cannot run here (missing optional dependency or data)."""
+
+
+def use_task(folder):
+    """Make a task folder's modules importable (each workload runs in its own process)."""
+    sys.path.insert(0, str(ROOT / folder))
+
+
+def fit_predict(name, model, X_train, y_train, X_test, metrics, predict="predict"):
+    """Fit and score one model, recording fit and predict seconds under its name."""
+    _, metrics[f"fit_seconds:{name}"] = timed(model.fit, X_train, y_train)
+    _, metrics[f"predict_seconds:{name}"] = timed(getattr(model, predict), X_test)
+    return model
+
+
+# --- AI tasks ---
+
+CHAT_INPUTS = ["hi there", "Who are you?", "how are you doing", "what's the weather like", "tell me a joke",
+               "what time is it", "hello!", "see you later", "who r you", "temperature outside?"]
+
+
+def chatbot(scale, data_dir):
+    use_task("AI/AI TASK 1")
+    from ai_task_1 import chatbot_response
+
+    inputs = CHAT_INPUTS * (10_000 * scale)
+    _, seconds = best_of(lambda: [chatbot_response(text) for text in inputs])
+    return {"responses": len(inputs), "responses_per_sec": len(inputs) / seconds}
+
+
+TICTACTOE_POSITIONS = [
+    ("         ", "X", "O"),   # AI opens
+    ("X        ", "O", "X"),   # AI answers a corner
+    ("    X    ", "O", "X"),   # AI answers the centre
+    ("X   O   X", "O", "X"),
+]
+
+
+def tictactoe(scale, data_dir):
+    use_task("AI/AI TASK 2")
+    import ai_task_2
+
+    # count minimax nodes once through a wrapper (recursive calls go through the module name),
+    # then time the unwrapped search
+    nodes, search = 0, ai_task_2.minimax
+
+    def counted(*args, **kwargs):
+        nonlocal nodes
+        nodes += 1
+        return search(*args, **kwargs)
+
+    ai_task_2.minimax = counted
+    try:
+        for cells, ai, human in TICTACTOE_POSITIONS:
+            ai_task_2.ai_move(list(cells), ai, human)
+    finally:
+        ai_task_2.minimax = search
+
+    repeats = 25 * scale
+    _, seconds = best_of(lambda: [ai_task_2.ai_move(list(cells), ai, human)
+                               for _ in range(repeats) for cells, ai, human in TICTACTOE_POSITIONS])
+    moves = repeats * len(TICTACTOE_POSITIONS)
+    return {"nodes_per_move": nodes / len(TICTACTOE_POSITIONS), "nodes_per_sec": nodes * repeats / seconds,
+            "moves_per_sec": moves / seconds}
+
+
+def face(scale, data_dir):
+    use_task("AI/AI TASK 5")
+    try:
+        import cv2  # noqa: F401
+        import face_recognition  # noqa: F401
+    except ImportError as e:
+        raise Unavailable(str(e))
+    import numpy as np
+    from ai_task_5 import label_faces, load_detector
+
+    # noise frames at webcam size and a random known encoding: measures the
+    # detection pass on every frame (random noise rarely contains a face)
+    rng = np.random.default_rng(42)
+    frames = rng.integers(0, 256, size=(20 * scale, 480, 640, 3), dtype=np.uint8)
+    detector, known = load_detector(), rng.normal(size=128)
+    _, seconds = best_of(lambda: [label_faces(frame.copy(), detector, known) for frame in frames])
+    return {"frames": len(frames), "frames_per_sec": len(frames) / seconds}
+
+
+# --- Data Science tasks ---
+
+def titanic(scale, data_dir):
+    use_task("Data Science/Data Science Task 1")
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import train_test_split
+    from ds_task_1 import build_pipeline, load_dataset
+
+    # the real passengers resampled to 20x (scale 1)
+    df = load_dataset(ROOT / "Data Science/Data Science Task 1/archive.zip")
+    df = df.sample(n=len(df) * 20 * scale, replace=True, random_state=42).reset_index(drop=True)
+    X, y = df.drop("Survived", axis=1), df["Survived"]
+    numeric = X.select_dtypes(include=["int64", "float64"]).columns.tolist()
+    categorical = X.select_dtypes(include=["object", "category", "string"]).columns.tolist()
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    metrics = {"rows": len(df)}
+    for name, model in {"LogisticRegression": LogisticRegression(max_iter=1000),
+                        "RandomForest": RandomForestClassifier(n_estimators=200, random_state=42)}.items():
+        fit_predict(name, build_pipeline(numeric, categorical, model), X_train, y_train, X_test, metrics)
+    return metrics
+
+
+def imdb(scale, data_dir):
+    use_task("Data Science/Data Science Task 2")
+    from sklearn.model_selection import train_test_split
+    from bench_features import make_titles
+    from ds_task_2 import NATIVE_CATEGORICAL_MODELS, make_models
+    from imdb_features import ImdbFeatureBuilder
+
+    df = make_titles(50_000 * scale)
+    train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+    builder, encode_seconds = timed(lambda: ImdbFeatureBuilder(min_count=2).fit(train_df))
+    metrics = {"rows": len(df), "encode_seconds": encode_seconds}
+    # the forests take minutes on the wide sparse matrix; the linear and histogram models cover both inputs
+    for name, model in make_models(["Ridge Regression", "Hist Gradient Boosting Regressor"]).items():
+        transform = builder.transform_frame if name in NATIVE_CATEGORICAL_MODELS else builder.transform
+        fit_predict(name, model, transform(train_df), train_df["rating"].to_numpy(), transform(test_df), metrics)
+    return metrics
+
+
+# --- ML tasks ---
+
+def genres(scale, data_dir):
+    use_task("ML/ML TASK 1")
+    from sklearn.model_selection import train_test_split
+    from genre_data import load_genre_frame
+    from genre_synth import write_corpus
+    from genre_training import fit_one, make_classifiers, make_vectorizer
+
+    n_rows = 20_000 * scale
+    archive = Path(data_dir) / f"genres_{n_rows}.zip"
+    if not archive.exists():
+        write_corpus(archive, n_rows)
+    df = load_genre_frame(archive)
+    X_train, X_test, y_train, y_test = train_test_split(
+        df["description"].to_numpy(dtype=object), df["genre"].to_numpy(dtype=object), test_size=0.18,
+        stratify=df["genre"], random_state=42)
+
+    vectorizer = make_vectorizer()
+    (X_train, X_test), vectorize_seconds = timed(lambda: (vectorizer.fit_transform(X_train), vectorizer.transform(X_test)))
+    metrics = {"rows": n_rows, "vectorize_seconds": vectorize_seconds}
+    for name, clf in make_classifiers().items():
+        # one at a time, so each fit time is its own (ml_task_1 fits them in parallel)
+        _, clf, metrics[f"fit_seconds:{name}"] = fit_one(name, clf, X_train, y_train)
+        _, metrics[f"predict_seconds:{name}"] = timed(clf.predict, X_test)
+    return metrics
+
+
+def fraud(scale, data_dir):
+    use_task("ML/ML TASK 2")
+    import contextlib
+    import io
+    from fraud_synth import ensure_fraud_dataset
+    from ml_task_2 import load_data, make_models, preprocess_data
+
+    n_rows = 100_000 * scale
+    with contextlib.redirect_stdout(io.StringIO()):
+        train, test = ensure_fraud_dataset(Path(data_dir) / f"fraud_{n_rows}", n_rows)
+        df, load_seconds = timed(load_data, train, test, cache_path=None)
+        (X_train, X_test, y_train, y_test), preprocess_seconds = timed(preprocess_data, df)
+    metrics = {"rows": n_rows, "load_seconds": load_seconds, "preprocess_seconds": preprocess_seconds}
+    for name, model in make_models().items():
+        fit_predict(name, model, X_train, y_train, X_test, metrics, predict="predict_proba")
+    return metrics
+
+
+def churn(scale, data_dir):
+    use_task("ML/ML TASK 3")
+    from sklearn.model_selection import train_test_split
+    from churn_data import ARCHIVE, load_churn, upsample
+    from ml_task_3 import make_models
+
+    # the real customers resampled to 5x (scale 1) with a little jitter
+    X, y = load_churn(ARCHIVE)
+    X, y = upsample(X, y, 5 * scale)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+    metrics = {"rows": len(X)}
+    for name, pipe in make_models().items():
+        fit_predict(name, pipe, X_train, y_train, X_test, metrics, predict="predict_proba")
+    return metrics
+
+
+# benchmark name -> (task script, workload)
+WORKLOADS = {
+    "chatbot": ("ai_task_1", chatbot),
+    "tictactoe": ("ai_task_2", tictactoe),
+    "face": ("ai_task_5", face),
+    "titanic": ("ds_task_1", titanic),
+    "imdb": ("ds_task_2/4", imdb),
+    "genres": ("ml_task_1", genres),
+    "fraud": ("ml_task_2", fraud),
+    "churn": ("ml_task_3", churn),
+}
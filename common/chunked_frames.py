@@ -0,0 +1,49 @@
+# chunked_frames.py
+"""Helpers shared by the chunked CSV loaders of the tasks.
+
+The task folders are not packages, so a loader puts this folder on sys.path
+and imports from it (see imdb_loading.py, genre_data.py and fraud_data.py).
+"""
+import numpy as np
+import pandas as pd
+
+
+def concat_chunks(chunks, empty=None):
+    """Concatenate typed chunks, merging per-chunk categories instead of falling back to object.
+
+    Each chunk is split into its columns and dropped before the next one is
+    read. Categorical columns are recoded against one running list of
+    categories, so only their integer codes are kept per chunk, and the other
+    columns are copied out of the chunk's blocks. The columns are then joined
+    one at a time, each freeing its parts, so the peak is about the finished
+    frame plus one chunk and one column.
+
+    Returns `empty` when there are no chunks, or raises ValueError if it is None.
+    """
+    parts, categories = {}, {}
+    for chunk in chunks:
+        for col in chunk.columns:
+            values = chunk[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                known = categories.get(col, values.cat.categories[:0])
+                categories[col] = known = known.append(values.cat.categories.difference(known, sort=False))
+                codes = values.cat.codes.to_numpy()
+                recoded = known.get_indexer(values.cat.categories)[codes]
+                values = np.where(codes >= 0, recoded, -1).astype(np.min_scalar_type(-len(known)))
+            else:
+                values = values.copy()
+            parts.setdefault(col, []).append(values)
+        del chunk, values
+    if not parts:
+        if empty is None:
+            raise ValueError("No data to concatenate.")
+        return empty
+    columns = {}
+    for col in list(parts):
+        col_parts = parts.pop(col)
+        if col in categories:
+            columns[col] = pd.Series(pd.Categorical.from_codes(np.concatenate(col_parts), categories[col]))
+        else:
+            columns[col] = pd.concat(col_parts, ignore_index=True)
+        del col_parts
+    return pd.DataFrame(columns, copy=False)